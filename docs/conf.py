@@ -1,27 +1,26 @@
-import os
-import sys
 import tomllib
 from datetime import datetime
+from functools import cache
 from pathlib import Path
 
-# Add the src directory to the path so sphinx can find the code
-sys.path.insert(0, os.path.abspath("../src"))
 
-# Get version information from pyproject.toml
-with open(Path(__file__).parent.parent / "pyproject.toml", "rb") as f:
-    pyproject = tomllib.load(f)
+@cache
+def _pyproject() -> dict:
+    """Read the project metadata table from pyproject.toml once."""
+    with open(Path(__file__).parent.parent / "pyproject.toml", "rb") as f:
+        return tomllib.load(f)["project"]
 
-project = pyproject["project"]["name"]
+
+project = _pyproject()["name"]
 copyright = f"{datetime.now().year}, Richard West"
 author = "Richard West"
-release = pyproject["project"]["version"]
+release = _pyproject()["version"]
 version = ".".join(release.split(".")[:2])
 
 extensions = [
-    "sphinx.ext.autodoc",
+    "autoapi.extension",
     "sphinx.ext.napoleon",
     "sphinx.ext.viewcode",
-    "sphinx_autodoc_typehints",
 ]
 
 templates_path = ["_templates"]
@@ -37,6 +36,14 @@ html_static_path = ["_static"]
 
 html_extra_path = ["_extra"]
 
+# autoapi parses the sources statically instead of importing the package.
+# API pages are laid out by hand in api.rst using the autoapi* directives.
+autoapi_type = "python"
+autoapi_dirs = ["../src/graphable"]
+autoapi_options = ["members", "show-inheritance", "show-module-summary"]
+autoapi_generate_api_docs = False
+autoapi_add_toctree_entry = False
+
 autodoc_member_order = "bysource"
 autodoc_typehints = "description"
 autodoc_class_signature = "separated"
@@ -8,11 +8,22 @@ build_dir = Path(__file__).parent / "_build" / "html"
 
 app = Starlette()
 if build_dir.exists():
-    app.mount("/", StaticFiles(directory=str(build_dir), html=True), name="static")
+    # The directory was just checked, so StaticFiles doesn't need to stat it again
+    app.mount(
+        "/",
+        StaticFiles(directory=str(build_dir), html=True, check_dir=False),
+        name="static",
+    )
 else:
     # Fallback if docs aren't built yet
     from starlette.responses import HTMLResponse
 
-    @app.route("/")
+    # The fallback page never changes, so build the response once
+    _FALLBACK_RESPONSE = HTMLResponse(
+        "<h1>Documentation not found. Run 'just docs' first.</h1>"
+    )
+
     async def homepage(request):
-        return HTMLResponse("<h1>Documentation not found. Run 'just docs' first.</h1>")
+        return _FALLBACK_RESPONSE
+
+    app.add_route("/", homepage)
@@ -28,18 +28,26 @@ def build_complex_project():
     # Build Graph
     g = Graph()
 
-    # Backend dependencies
-    g.add_edge(db, api, label="provides data")
-    g.add_edge(api, worker, label="enqueues tasks")
-
-    # Frontend dependencies
-    g.add_edge(api, web, label="REST API")
-    g.add_edge(api, mobile, label="gRPC")
+    g.add_edges_from(
+        [
+            # Backend dependencies
+            (db, api, {"label": "provides data"}),
+            (api, worker, {"label": "enqueues tasks"}),
+            # Frontend dependencies
+            (api, web, {"label": "REST API"}),
+            (api, mobile, {"label": "gRPC"}),
+        ]
+    )
 
     # Observability (depends on everything)
-    for node in [db, api, worker, web, mobile]:
-        g.add_edge(node, logging, label="logs")
-        g.add_edge(node, monitoring, label="metrics")
+    g.add_edges_from(
+        edge
+        for node in [db, api, worker, web, mobile]
+        for edge in (
+            (node, logging, {"label": "logs"}),
+            (node, monitoring, {"label": "metrics"}),
+        )
+    )
 
     # Metadata for analysis
     db.duration = 15.0
@@ -71,22 +79,19 @@ def main():
     cp = g.critical_path()
     print(f"Critical Path: {' -> '.join([n.reference for n in cp])}")
 
-    analysis = g.cpm_analysis()
-    max_duration = max(v["EF"] for v in analysis.values())
+    _, max_duration = g.cpm_analysis_with_duration()
     print(f"Estimated Project Duration: {max_duration} units")
 
     # 2. Impact Analysis (Downstream)
     print("\n--- 2. Impact Analysis ---")
     print("What is impacted if the 'API Gateway' changes?")
-    impacted = list(g.descendants(api))
-    for n in impacted:
+    for n in g.descendants(api):
         print(f"  - {n.reference}")
 
     # 3. Traceability (Upstream)
     print("\n--- 3. Traceability Analysis ---")
     print("What does the 'Mobile App' depend on?")
-    deps = list(g.ancestors(mobile))
-    for n in deps:
+    for n in g.ancestors(mobile):
         print(f"  - {n.reference}")
 
     # 4. Filtered Subgraphs
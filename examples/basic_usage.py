@@ -1,38 +1,22 @@
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from graphable.graph import Graph
 from graphable.graphable import Graphable
 from graphable.views.asciiflow import create_topology_ascii_flow
 from graphable.views.csv import create_topology_csv
-from graphable.views.d2 import (
-    D2StylingConfig,
-    create_topology_d2,
-    export_topology_d2_image,
-)
+from graphable.views.d2 import D2StylingConfig, create_topology_d2
 from graphable.views.graphml import create_topology_graphml
 from graphable.views.graphviz import (
     GraphvizStylingConfig,
     create_topology_graphviz_dot,
-    export_topology_graphviz_image,
-)
-from graphable.views.html import (
-    HtmlStylingConfig,
-    create_topology_html,
-    export_topology_html,
 )
+from graphable.views.html import HtmlStylingConfig, create_topology_html
 from graphable.views.json import create_topology_json
-from graphable.views.mermaid import (
-    MermaidStylingConfig,
-    create_topology_mermaid_mmd,
-    export_topology_mermaid_image,
-)
-from graphable.views.plantuml import (
-    PlantUmlStylingConfig,
-    create_topology_plantuml,
-    export_topology_plantuml_image,
-)
+from graphable.views.mermaid import MermaidStylingConfig, create_topology_mermaid_mmd
+from graphable.views.plantuml import PlantUmlStylingConfig, create_topology_plantuml
 from graphable.views.texttree import create_topology_tree_txt
 from graphable.views.tikz import create_topology_tikz
 from graphable.views.toml import create_topology_toml
@@ -87,11 +71,15 @@ def main():
     ui = Graphable("React")
 
     g = Graph()
-    g.add_edge(db, api, weight=5)
-    g.add_edge(cache, api, weight=2)
-    g.add_edge(api, ui, weight=1)
-    g.add_edge(db, worker, weight=10)
-    g.add_edge(api, worker, weight=2)
+    g.add_edges_from(
+        [
+            (db, api, {"weight": 5}),
+            (cache, api, {"weight": 2}),
+            (api, ui, {"weight": 1}),
+            (db, worker, {"weight": 10}),
+            (api, worker, {"weight": 2}),
+        ]
+    )
 
     # Set durations for CPM demo
     db.duration = 10
@@ -132,20 +120,27 @@ def main():
     for i, layer in enumerate(g.parallelized_topological_order()):
         print(f"  Layer {i}: {[n.reference for n in layer]}")
 
+    # Run a task per node, layer by layer, on a thread pool
+    with ThreadPoolExecutor() as executor:
+        results = g.map_layers(lambda n: n.duration, executor=executor)
+    print(
+        f"Layered execution results: {[(n.reference, d) for n, d in results.items()]}"
+    )
+
     # 4. Transitive Reduction
     print("\n--- 4. Transitive Reduction ---")
-    print(f"Edges before reduction: {sum(len(n.dependents) for n in g)}")
+    print(f"Edges before reduction: {g.edge_count}")
     reduced_g = g.transitive_reduction()
-    print(f"Edges after reduction: {sum(len(n.dependents) for n in reduced_g)}")
+    print(f"Edges after reduction: {reduced_g.edge_count}")
 
     # 5. Advanced Analysis (v0.6.0)
     print("\n--- 5. Advanced Analysis (v0.6.0) ---")
 
     # CPM Analysis
-    analysis = g.cpm_analysis()
+    _, project_duration = g.cpm_analysis_with_duration()
     cp = g.critical_path()
     print(f"Critical Path: {[n.reference for n in cp]}")
-    print(f"Project Duration: {max(v['EF'] for v in analysis.values())}")
+    print(f"Project Duration: {project_duration}")
 
     # Slicing
     upstream = g.upstream_of(ui)
@@ -158,7 +153,7 @@ def main():
 
     # Transitive Closure
     closure = g.transitive_closure()
-    print(f"Transitive Closure edges: {sum(len(n.dependents) for n in closure)}")
+    print(f"Transitive Closure edges: {closure.edge_count}")
 
     # BFS/DFS Traversals
     print("\n--- 6. Native Traversals (BFS & DFS) ---")
@@ -173,7 +168,7 @@ def main():
         print(f"  - {node.reference}")
 
     # Diffing Demo
-    g_v2 = Graph.from_json(create_topology_json(g))
+    g_v2 = g.clone(include_edges=True)
     new_task = Graphable("Analytics")
     g_v2.add_edge(g_v2["Postgres"], new_task)
 
@@ -265,9 +260,7 @@ def main():
     # 20. Mutation Demo
     print("\n--- 20. Mutation Demo ---")
     g.remove_edge(db, ui)
-    print(
-        f"Removed redundant edge manually. Edges: {sum(len(n.dependents) for n in g)}"
-    )
+    print(f"Removed redundant edge manually. Edges: {g.edge_count}")
     g.remove_node(cache)
     print(f"Removed Redis. Graph size: {len(g)}")
 
@@ -294,44 +287,73 @@ def main():
         out_dir.mkdir(exist_ok=True)
         print(f"\n--- Generating Assets in {out_dir}/ ---")
 
-        # Mermaid SVG
+        # SVG renderers are independent external processes, so run them
+        # concurrently and report the results in a stable order.
+        svg_jobs = []
         if args.mermaid_svg:
+            from graphable.views.mermaid import export_topology_mermaid_image
+
             mermaid_out = out_dir / "topology_mermaid.svg"
-            try:
-                export_topology_mermaid_image(g, mermaid_out)
-                print(f"Successfully generated: {mermaid_out}")
-            except Exception as e:
-                print(f"Failed to generate Mermaid SVG: {e}", file=sys.stderr)
+            svg_jobs.append(
+                (
+                    "Mermaid",
+                    mermaid_out,
+                    export_topology_mermaid_image,
+                    (g, mermaid_out),
+                )
+            )
 
-        # Graphviz SVG
         if args.graphviz_svg:
+            from graphable.views.graphviz import export_topology_graphviz_image
+
             graphviz_out = out_dir / "topology_graphviz.svg"
-            try:
-                export_topology_graphviz_image(g, graphviz_out, gv_config)
-                print(f"Successfully generated: {graphviz_out}")
-            except Exception as e:
-                print(f"Failed to generate Graphviz SVG: {e}", file=sys.stderr)
+            svg_jobs.append(
+                (
+                    "Graphviz",
+                    graphviz_out,
+                    export_topology_graphviz_image,
+                    (g, graphviz_out, gv_config),
+                )
+            )
 
-        # D2 SVG
         if args.d2_svg:
+            from graphable.views.d2 import export_topology_d2_image
+
             d2_out = out_dir / "topology_d2.svg"
-            try:
-                export_topology_d2_image(g, d2_out, d2_config)
-                print(f"Successfully generated: {d2_out}")
-            except Exception as e:
-                print(f"Failed to generate D2 SVG: {e}", file=sys.stderr)
+            svg_jobs.append(
+                ("D2", d2_out, export_topology_d2_image, (g, d2_out, d2_config))
+            )
 
-        # PlantUML SVG
         if args.puml_svg:
+            from graphable.views.plantuml import export_topology_plantuml_image
+
             puml_out = out_dir / "topology_plantuml.svg"
-            try:
-                export_topology_plantuml_image(g, puml_out, puml_config)
-                print(f"Successfully generated: {puml_out}")
-            except Exception as e:
-                print(f"Failed to generate PlantUML SVG: {e}", file=sys.stderr)
+            svg_jobs.append(
+                (
+                    "PlantUML",
+                    puml_out,
+                    export_topology_plantuml_image,
+                    (g, puml_out, puml_config),
+                )
+            )
+
+        if svg_jobs:
+            with ThreadPoolExecutor(max_workers=len(svg_jobs)) as executor:
+                futures = [
+                    (name, out, executor.submit(fn, *fn_args))
+                    for name, out, fn, fn_args in svg_jobs
+                ]
+                for name, out, future in futures:
+                    try:
+                        future.result()
+                        print(f"Successfully generated: {out}")
+                    except Exception as e:
+                        print(f"Failed to generate {name} SVG: {e}", file=sys.stderr)
 
         # Interactive HTML
         if args.interactive_html:
+            from graphable.views.html import export_topology_html
+
             html_out = out_dir / "topology_interactive.html"
             try:
                 export_topology_html(g, html_out, html_config)
@@ -1,4 +1,5 @@
-from argparse import ArgumentParser
+from argparse import ArgumentParser, Namespace
+from collections.abc import Callable
 from json import dumps
 from pathlib import Path
 from sys import exit
@@ -18,6 +19,178 @@ from graphable.cli.commands.core import (
 )
 from graphable.enums import Engine
 
+_ENGINE_CHOICES: tuple[str, ...] = tuple(e.value.lower() for e in Engine)
+
+
+def _add_filter_args(parser: ArgumentParser) -> None:
+    parser.add_argument("-t", "--tag", help="Filter by tag")
+    parser.add_argument("--upstream-of", help="Filter to ancestors of node")
+    parser.add_argument("--downstream-of", help="Filter to descendants of node")
+
+
+def _run_info(args: Namespace) -> None:
+    data = info_command(
+        args.file,
+        tag=args.tag,
+        upstream_of=args.upstream_of,
+        downstream_of=args.downstream_of,
+    )
+    lines = [
+        f"Nodes: {data['nodes']}",
+        f"Edges: {data['edges']}",
+        f"Sources: {', '.join(data['sources'])}",
+        f"Sinks: {', '.join(data['sinks'])}",
+    ]
+    if data.get("project_duration") is not None:
+        lines.append(f"Project Duration: {data['project_duration']}")
+        lines.append(f"Critical Path Length: {data['critical_path_length']}")
+    print("\n".join(lines))
+
+
+def _run_check(args: Namespace) -> None:
+    data = check_command(
+        args.file,
+        tag=args.tag,
+        upstream_of=args.upstream_of,
+        downstream_of=args.downstream_of,
+    )
+    if data["valid"]:
+        print("Graph is valid.")
+    else:
+        print(f"Graph is invalid: {data['error']}")
+        exit(1)
+
+
+def _run_reduce(args: Namespace) -> None:
+    reduce_command(
+        args.input,
+        args.output,
+        embed_checksum=args.embed,
+        tag=args.tag,
+        upstream_of=args.upstream_of,
+        downstream_of=args.downstream_of,
+    )
+    print(f"Reduced graph saved to {args.output}")
+
+
+def _run_convert(args: Namespace) -> None:
+    convert_command(
+        args.input,
+        args.output,
+        embed_checksum=args.embed,
+        tag=args.tag,
+        upstream_of=args.upstream_of,
+        downstream_of=args.downstream_of,
+    )
+    print(f"Converted {args.input} to {args.output}")
+
+
+def _run_render(args: Namespace) -> None:
+    render_command(
+        args.input,
+        args.output,
+        engine=args.engine,
+        tag=args.tag,
+        upstream_of=args.upstream_of,
+        downstream_of=args.downstream_of,
+    )
+    print(f"Rendered {args.input} to {args.output}")
+
+
+def _run_checksum(args: Namespace) -> None:
+    print(
+        checksum_command(
+            args.file,
+            tag=args.tag,
+            upstream_of=args.upstream_of,
+            downstream_of=args.downstream_of,
+        )
+    )
+
+
+def _run_verify(args: Namespace) -> None:
+    data = verify_command(
+        args.file,
+        args.expected,
+        tag=args.tag,
+        upstream_of=args.upstream_of,
+        downstream_of=args.downstream_of,
+    )
+    if data["valid"] is True:
+        print("Checksum verified.")
+    elif data["valid"] is False:
+        print(f"Checksum mismatch! Actual: {data['actual']}")
+        exit(1)
+    else:
+        print(f"No checksum found to verify. Current: {data['actual']}")
+
+
+def _run_write_checksum(args: Namespace) -> None:
+    write_checksum_command(
+        args.file,
+        args.output,
+        tag=args.tag,
+        upstream_of=args.upstream_of,
+        downstream_of=args.downstream_of,
+    )
+    print(f"Checksum written to {args.output}")
+
+
+def _run_diff(args: Namespace) -> None:
+    if args.output:
+        diff_visual_command(args.file1, args.file2, args.output, tag=args.tag)
+        print(f"Visual diff saved to {args.output}")
+    else:
+        data = diff_command(args.file1, args.file2, tag=args.tag)
+
+        # Edge tuples are shown as "u->v"; remaining sets are encoded as
+        # lists by the encoder instead of being copied up front.
+        for k in ["added_edges", "removed_edges", "modified_edges"]:
+            data[k] = [f"{u}->{v}" for u, v in data[k]]
+
+        print(dumps(data, indent=2, default=list))
+
+
+def _run_paths(args: Namespace) -> None:
+    paths = paths_command(
+        args.file,
+        args.source,
+        args.target,
+        tag=args.tag,
+        upstream_of=args.upstream_of,
+        downstream_of=args.downstream_of,
+    )
+    if not paths:
+        print(f"No paths found from '{args.source}' to '{args.target}'.")
+    else:
+        lines = [f"Found {len(paths)} paths from '{args.source}' to '{args.target}':"]
+        lines.extend(f"{i}. {' -> '.join(path)}" for i, path in enumerate(paths, 1))
+        # One write for the whole listing rather than one per path
+        print("\n".join(lines))
+
+
+def _run_serve(args: Namespace) -> None:
+    print(f"Serving {args.file} on http://127.0.0.1:{args.port}")
+    # Note: serve_command needs update too
+    from graphable.cli.commands.serve import serve_command
+
+    serve_command(args.file, port=args.port, tag=args.tag)
+
+
+_HANDLERS: dict[str, Callable[[Namespace], None]] = {
+    "info": _run_info,
+    "check": _run_check,
+    "reduce": _run_reduce,
+    "convert": _run_convert,
+    "render": _run_render,
+    "checksum": _run_checksum,
+    "verify": _run_verify,
+    "write-checksum": _run_write_checksum,
+    "diff": _run_diff,
+    "paths": _run_paths,
+    "serve": _run_serve,
+}
+
 
 def run_bare():
     parser = ArgumentParser(prog="graphable", description="Graphable CLI (Bare-bones)")
@@ -26,16 +199,12 @@ def run_bare():
     # info
     info_p = subparsers.add_parser("info", help="Get graph information")
     info_p.add_argument("file", type=Path, help="Input graph file")
-    info_p.add_argument("-t", "--tag", help="Filter by tag")
-    info_p.add_argument("--upstream-of", help="Filter to ancestors of node")
-    info_p.add_argument("--downstream-of", help="Filter to descendants of node")
+    _add_filter_args(info_p)
 
     # check
     check_p = subparsers.add_parser("check", help="Validate graph (cycles/consistency)")
     check_p.add_argument("file", type=Path, help="Input graph file")
-    check_p.add_argument("-t", "--tag", help="Filter by tag")
-    check_p.add_argument("--upstream-of", help="Filter to ancestors of node")
-    check_p.add_argument("--downstream-of", help="Filter to descendants of node")
+    _add_filter_args(check_p)
 
     # reduce
     reduce_p = subparsers.add_parser("reduce", help="Perform transitive reduction")
@@ -44,9 +213,7 @@ def run_bare():
     reduce_p.add_argument(
         "--embed", action="store_true", help="Embed checksum in output"
     )
-    reduce_p.add_argument("-t", "--tag", help="Filter by tag")
-    reduce_p.add_argument("--upstream-of", help="Filter to ancestors of node")
-    reduce_p.add_argument("--downstream-of", help="Filter to descendants of node")
+    _add_filter_args(reduce_p)
 
     # convert
     convert_p = subparsers.add_parser("convert", help="Convert between formats")
@@ -55,9 +222,7 @@ def run_bare():
     convert_p.add_argument(
         "--embed", action="store_true", help="Embed checksum in output"
     )
-    convert_p.add_argument("-t", "--tag", help="Filter by tag")
-    convert_p.add_argument("--upstream-of", help="Filter to ancestors of node")
-    convert_p.add_argument("--downstream-of", help="Filter to descendants of node")
+    _add_filter_args(convert_p)
 
     # render
     render_p = subparsers.add_parser("render", help="Render graph as image")
@@ -66,27 +231,21 @@ def run_bare():
     render_p.add_argument(
         "-e",
         "--engine",
-        choices=[e.value.lower() for e in Engine],
+        choices=_ENGINE_CHOICES,
         help="Rendering engine",
     )
-    render_p.add_argument("-t", "--tag", help="Filter by tag")
-    render_p.add_argument("--upstream-of", help="Filter to ancestors of node")
-    render_p.add_argument("--downstream-of", help="Filter to descendants of node")
+    _add_filter_args(render_p)
 
     # checksum
     checksum_p = subparsers.add_parser("checksum", help="Calculate graph checksum")
     checksum_p.add_argument("file", type=Path, help="Graph file")
-    checksum_p.add_argument("-t", "--tag", help="Filter by tag")
-    checksum_p.add_argument("--upstream-of", help="Filter to ancestors of node")
-    checksum_p.add_argument("--downstream-of", help="Filter to descendants of node")
+    _add_filter_args(checksum_p)
 
     # verify
     verify_p = subparsers.add_parser("verify", help="Verify graph checksum")
     verify_p.add_argument("file", type=Path, help="Graph file")
     verify_p.add_argument("--expected", help="Expected checksum (hex)")
-    verify_p.add_argument("-t", "--tag", help="Filter by tag")
-    verify_p.add_argument("--upstream-of", help="Filter to ancestors of node")
-    verify_p.add_argument("--downstream-of", help="Filter to descendants of node")
+    _add_filter_args(verify_p)
 
     # write-checksum
     wc_p = subparsers.add_parser(
@@ -94,9 +253,7 @@ def run_bare():
     )
     wc_p.add_argument("file", type=Path, help="Graph file")
     wc_p.add_argument("output", type=Path, help="Output checksum file")
-    wc_p.add_argument("-t", "--tag", help="Filter by tag")
-    wc_p.add_argument("--upstream-of", help="Filter to ancestors of node")
-    wc_p.add_argument("--downstream-of", help="Filter to descendants of node")
+    _add_filter_args(wc_p)
 
     # diff
     diff_p = subparsers.add_parser("diff", help="Compare two graphs")
@@ -110,9 +267,7 @@ def run_bare():
     paths_p.add_argument("file", type=Path, help="Graph file")
     paths_p.add_argument("source", help="Source node reference")
     paths_p.add_argument("target", help="Target node reference")
-    paths_p.add_argument("-t", "--tag", help="Filter by tag")
-    paths_p.add_argument("--upstream-of", help="Filter to ancestors of node")
-    paths_p.add_argument("--downstream-of", help="Filter to descendants of node")
+    _add_filter_args(paths_p)
 
     # serve
     serve_p = subparsers.add_parser("serve", help="Serve interactive visualization")
@@ -122,145 +277,11 @@ def run_bare():
 
     args = parser.parse_args()
 
-    if args.command == "info":
-        data = info_command(
-            args.file,
-            tag=args.tag,
-            upstream_of=args.upstream_of,
-            downstream_of=args.downstream_of,
-        )
-        print(f"Nodes: {data['nodes']}")
-        print(f"Edges: {data['edges']}")
-        print(f"Sources: {', '.join(data['sources'])}")
-        print(f"Sinks: {', '.join(data['sinks'])}")
-        if data.get("project_duration") is not None:
-            print(f"Project Duration: {data['project_duration']}")
-            print(f"Critical Path Length: {data['critical_path_length']}")
-
-    elif args.command == "check":
-        data = check_command(
-            args.file,
-            tag=args.tag,
-            upstream_of=args.upstream_of,
-            downstream_of=args.downstream_of,
-        )
-        if data["valid"]:
-            print("Graph is valid.")
-        else:
-            print(f"Graph is invalid: {data['error']}")
-            exit(1)
-
-    elif args.command == "reduce":
-        reduce_command(
-            args.input,
-            args.output,
-            embed_checksum=args.embed,
-            tag=args.tag,
-            upstream_of=args.upstream_of,
-            downstream_of=args.downstream_of,
-        )
-        print(f"Reduced graph saved to {args.output}")
-
-    elif args.command == "convert":
-        convert_command(
-            args.input,
-            args.output,
-            embed_checksum=args.embed,
-            tag=args.tag,
-            upstream_of=args.upstream_of,
-            downstream_of=args.downstream_of,
-        )
-        print(f"Converted {args.input} to {args.output}")
-
-    elif args.command == "render":
-        render_command(
-            args.input,
-            args.output,
-            engine=args.engine,
-            tag=args.tag,
-            upstream_of=args.upstream_of,
-            downstream_of=args.downstream_of,
-        )
-        print(f"Rendered {args.input} to {args.output}")
-
-    elif args.command == "checksum":
-        print(
-            checksum_command(
-                args.file,
-                tag=args.tag,
-                upstream_of=args.upstream_of,
-                downstream_of=args.downstream_of,
-            )
-        )
-
-    elif args.command == "verify":
-        data = verify_command(
-            args.file,
-            args.expected,
-            tag=args.tag,
-            upstream_of=args.upstream_of,
-            downstream_of=args.downstream_of,
-        )
-        if data["valid"] is True:
-            print("Checksum verified.")
-        elif data["valid"] is False:
-            print(f"Checksum mismatch! Actual: {data['actual']}")
-            exit(1)
-        else:
-            print(f"No checksum found to verify. Current: {data['actual']}")
-
-    elif args.command == "write-checksum":
-        write_checksum_command(
-            args.file,
-            args.output,
-            tag=args.tag,
-            upstream_of=args.upstream_of,
-            downstream_of=args.downstream_of,
-        )
-        print(f"Checksum written to {args.output}")
-
-    elif args.command == "diff":
-        if args.output:
-            diff_visual_command(args.file1, args.file2, args.output, tag=args.tag)
-            print(f"Visual diff saved to {args.output}")
-        else:
-            data = diff_command(args.file1, args.file2, tag=args.tag)
-
-            # Convert sets to lists for JSON serialization
-            serializable_data = {
-                k: list(v) if isinstance(v, set) else v for k, v in data.items()
-            }
-            # Special handling for edge tuples
-            for k in ["added_edges", "removed_edges", "modified_edges"]:
-                serializable_data[k] = [f"{u}->{v}" for u, v in data[k]]
-
-            print(dumps(serializable_data, indent=2))
-
-    elif args.command == "paths":
-        paths = paths_command(
-            args.file,
-            args.source,
-            args.target,
-            tag=args.tag,
-            upstream_of=args.upstream_of,
-            downstream_of=args.downstream_of,
-        )
-        if not paths:
-            print(f"No paths found from '{args.source}' to '{args.target}'.")
-        else:
-            print(f"Found {len(paths)} paths from '{args.source}' to '{args.target}':")
-            for i, path in enumerate(paths, 1):
-                print(f"{i}. {' -> '.join(path)}")
-
-    elif args.command == "serve":
-        print(f"Serving {args.file} on http://127.0.0.1:{args.port}")
-        # Note: serve_command needs update too
-        from graphable.cli.commands.serve import serve_command
-
-        serve_command(args.file, port=args.port, tag=args.tag)
-
-    else:
+    handler = _HANDLERS.get(args.command)
+    if handler is None:
         parser.print_help()
+    else:
+        handler(args)
 
 
 if __name__ == "__main__":
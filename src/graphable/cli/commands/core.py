@@ -1,8 +1,11 @@
+from __future__ import annotations
+
 from pathlib import Path
 from typing import Any, Callable
 
 from ...enums import Engine
 from ...graph import Graph
+from ...parsers.utils import extract_checksum
 from ...registry import EXPORTERS, PARSERS
 
 
@@ -44,7 +47,7 @@ def info_command(
 
     stats = {
         "nodes": len(g),
-        "edges": sum(len(node.dependents) for node in g),
+        "edges": g.edge_count,
         "sources": [n.reference for n in g.sources],
         "sinks": [n.reference for n in g.sinks],
         "project_duration": None,
@@ -53,8 +56,9 @@ def info_command(
 
     # Check if we should run CPM (if any node has duration > 0)
     if any(n.duration > 0 for n in g):
-        analysis = g.cpm_analysis()
-        stats["project_duration"] = max((v["EF"] for v in analysis.values()), default=0)
+        # Both read the same cached CPM pass
+        _, duration = g.cpm_analysis_with_duration()
+        stats["project_duration"] = duration
         stats["critical_path_length"] = len(g.critical_path())
 
     return stats
@@ -128,8 +132,6 @@ def verify_command(
 
     if expected is None:
         # Check if there is an embedded checksum
-        from ...parsers.utils import extract_checksum
-
         expected = extract_checksum(path)
 
     if expected is None:
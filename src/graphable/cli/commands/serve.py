@@ -1,4 +1,4 @@
-from asyncio import get_event_loop
+from asyncio import create_task, gather, run
 from html import escape
 from logging import getLogger
 from pathlib import Path
@@ -22,6 +22,8 @@ class Server:
         self.path = path
         self.tag = tag
         self.connections: set[WebSocket] = set()
+        # Encoded page, reused until watch_file sees the graph file change
+        self._page: bytes | None = None
         self.app = Starlette(
             routes=[
                 Route("/", self.index),
@@ -31,9 +33,10 @@ class Server:
 
     async def index(self, request):
         try:
-            g = load_graph(self.path, tag=self.tag)
-            html = create_topology_html(g)
-            return HTMLResponse(html)
+            if self._page is None:
+                g = load_graph(self.path, tag=self.tag)
+                self._page = create_topology_html(g).encode("utf-8")
+            return HTMLResponse(self._page)
         except Exception as e:
             return HTMLResponse(
                 f"<h1>Error loading graph</h1><pre>{escape(str(e))}</pre>",
@@ -47,13 +50,22 @@ class Server:
             while True:
                 await websocket.receive_text()
         except Exception:
-            self.connections.remove(websocket)
+            # watch_file may already have dropped this socket after a failed send
+            self.connections.discard(websocket)
 
     async def watch_file(self):
         async for changes in awatch(self.path):
             logger.info(f"File {self.path} changed, reloading...")
-            for ws in self.connections:
-                await ws.send_text("reload")
+            self._page = None
+            # Send to every client concurrently; drop sockets whose send failed
+            connections = list(self.connections)
+            results = await gather(
+                *(ws.send_text("reload") for ws in connections),
+                return_exceptions=True,
+            )
+            for ws, result in zip(connections, results):
+                if isinstance(result, BaseException):
+                    self.connections.discard(ws)
 
 
 def serve_command(path: Path, port: int = 8000, tag: str | None = None):
@@ -62,6 +74,12 @@ def serve_command(path: Path, port: int = 8000, tag: str | None = None):
     config = Config(server.app, host="127.0.0.1", port=port, log_level="info")
     uv_server = UvicornServer(config)
 
-    loop = get_event_loop()
-    loop.create_task(server.watch_file())
-    loop.run_until_complete(uv_server.serve())
+    async def _main():
+        watcher = create_task(server.watch_file())
+        try:
+            await uv_server.serve()
+        finally:
+            # The watcher never finishes on its own; stop it with the server
+            watcher.cancel()
+
+    run(_main())
@@ -1,27 +1,33 @@
+from os import environ
 from sys import argv
 
 
-def app():
-    """Main entry point that dispatches to rich or bare CLI."""
-    # Check for --bare flag before anything else
+def _bare_requested() -> bool:
+    """Check for the --bare flag or the GRAPHABLE_BARE environment variable."""
     if "--bare" in argv:
         # Remove --bare from argv so subparsers don't choke on it
         argv.remove("--bare")
-        from .bare_cli import run_bare
-
-        run_bare()
-        return
+        return True
+    return bool(environ.get("GRAPHABLE_BARE"))
 
-    try:
-        # Try to use the rich CLI if dependencies are available
-        from .rich_cli import app as rich_app
 
-        rich_app()
-    except ImportError:
-        # Fallback to bare-bones CLI
-        from .bare_cli import run_bare
-
-        run_bare()
+def app():
+    """Main entry point that dispatches to rich or bare CLI."""
+    if not _bare_requested():
+        try:
+            # Try to use the rich CLI if dependencies are available
+            from .rich_cli import app as rich_app
+        except ImportError:
+            pass
+        else:
+            # Errors raised while running a command must not trigger the fallback
+            rich_app()
+            return
+
+    # Fallback to bare-bones CLI
+    from .bare_cli import run_bare
+
+    run_bare()
 
 
 if __name__ == "__main__":
@@ -1,3 +1,4 @@
+from itertools import islice
 from pathlib import Path
 
 from rich.console import Console
@@ -18,12 +19,30 @@ from graphable.cli.commands.core import (
     verify_command,
     write_checksum_command,
 )
-from graphable.cli.commands.serve import serve_command
 from graphable.enums import Engine
 
 app = Typer(help="Graphable CLI (Rich)")
 console = Console()
 
+# Rows of the diff table, and how many entries a single cell lists
+_DIFF_ROWS: tuple[tuple[str, str], ...] = (
+    ("Added Nodes", "added_nodes"),
+    ("Removed Nodes", "removed_nodes"),
+    ("Modified Nodes", "modified_nodes"),
+    ("Added Edges", "added_edges"),
+    ("Removed Edges", "removed_edges"),
+    ("Modified Edges", "modified_edges"),
+)
+_DIFF_CELL_LIMIT = 50
+
+
+def _make_table(title: str, key_header: str, value_header: str) -> Table:
+    """Create the two-column key/value table used by the summary commands."""
+    table = Table(title=title)
+    table.add_column(key_header, style="cyan")
+    table.add_column(value_header, style="magenta")
+    return table
+
 
 @app.command()
 def info(
@@ -43,9 +62,7 @@ def info(
         )
 
         title = f"Graph Summary: {file.name}" + (f" (Tag: {tag})" if tag else "")
-        table = Table(title=title)
-        table.add_column("Property", style="cyan")
-        table.add_column("Value", style="magenta")
+        table = _make_table(title, "Property", "Value")
 
         table.add_row("Nodes", str(data["nodes"]))
         table.add_row("Edges", str(data["edges"]))
@@ -283,32 +300,21 @@ def diff(
             console.print("[green]Graphs are identical.[/green]")
             return
 
-        table = Table(title=f"Graph Diff: {file1.name} vs {file2.name}")
-        table.add_column("Category", style="cyan")
-        table.add_column("Changes", style="magenta")
-
-        if data["added_nodes"]:
-            table.add_row("Added Nodes", ", ".join(map(str, data["added_nodes"])))
-        if data["removed_nodes"]:
-            table.add_row("Removed Nodes", ", ".join(map(str, data["removed_nodes"])))
-        if data["modified_nodes"]:
-            table.add_row("Modified Nodes", ", ".join(map(str, data["modified_nodes"])))
-
-        if data["added_edges"]:
-            table.add_row(
-                "Added Edges",
-                ", ".join(f"{u}->{v}" for u, v in data["added_edges"]),
-            )
-        if data["removed_edges"]:
-            table.add_row(
-                "Removed Edges",
-                ", ".join(f"{u}->{v}" for u, v in data["removed_edges"]),
-            )
-        if data["modified_edges"]:
-            table.add_row(
-                "Modified Edges",
-                ", ".join(f"{u}->{v}" for u, v in data["modified_edges"]),
-            )
+        table = _make_table(
+            f"Graph Diff: {file1.name} vs {file2.name}", "Category", "Changes"
+        )
+
+        for label, key in _DIFF_ROWS:
+            items = data[key]
+            if not items:
+                continue
+            if key.endswith("_edges"):
+                shown = [f"{u}->{v}" for u, v in islice(items, _DIFF_CELL_LIMIT)]
+            else:
+                shown = [str(ref) for ref in islice(items, _DIFF_CELL_LIMIT)]
+            if len(items) > _DIFF_CELL_LIMIT:
+                shown.append(f"... (+{len(items) - _DIFF_CELL_LIMIT} more)")
+            table.add_row(label, ", ".join(shown))
 
         console.print(table)
     except Exception as e:
@@ -365,6 +371,9 @@ def serve(
     try:
         console.print(f"[green]Serving {file} on http://127.0.0.1:{port}[/green]")
         console.print("[yellow]Press Ctrl+C to stop.[/yellow]")
+        # Deferred: the web server stack is only needed by this command
+        from graphable.cli.commands.serve import serve_command
+
         serve_command(file, port=port)
     except Exception as e:
         console.print(f"[red]Error:[/red] {e}")
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+from collections import deque
+from collections.abc import Hashable, Mapping
+from concurrent.futures import Executor
 from graphlib import CycleError, TopologicalSorter
 from hashlib import blake2b
 from logging import getLogger
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Callable, Iterator
+from typing import Any, Callable, Iterable, Iterator
 
 from .enums import Direction, Engine
 from .errors import GraphConsistencyError, GraphCycleError
@@ -12,6 +16,49 @@ from .graphable import Graphable
 
 logger = getLogger(__name__)
 
+# Number of checksum fields joined into a single hasher.update() call
+_CHECKSUM_BATCH = 4096
+
+# Node color hints used by diff_graph, keyed by diff status
+_DIFF_COLORS = {"added": "green", "removed": "red", "modified": "orange"}
+
+# Node colors for the depth-first search in suggest_cycle_breaks
+_ON_STACK = 1
+_DONE = 2
+
+
+def _reaches_cycle(nodes: Iterable[Graphable[Any]]) -> bool:
+    """
+    Check whether any cycle is reachable by following dependents from the given nodes.
+    Nodes outside the graph are followed too, matching the per-node check in add_node.
+
+    Args:
+        nodes (Iterable[Graphable[Any]]): The nodes to start from.
+
+    Returns:
+        bool: True if a cycle was found, False otherwise.
+    """
+    color: dict[Graphable[Any], int] = {}
+    for root in nodes:
+        if root in color:
+            continue
+        color[root] = _ON_STACK
+        stack = [(root, iter(root._dependents))]
+        while stack:
+            node, neighbors = stack[-1]
+            for neighbor in neighbors:
+                state = color.get(neighbor)
+                if state is None:
+                    color[neighbor] = _ON_STACK
+                    stack.append((neighbor, iter(neighbor._dependents)))
+                    break
+                if state == _ON_STACK:
+                    return True
+            else:
+                color[node] = _DONE
+                stack.pop()
+    return False
+
 
 class Graph[T: Graphable[Any]]:
     """
@@ -31,13 +78,25 @@ class Graph[T: Graphable[Any]]:
             GraphCycleError: If the initial set of nodes contains a cycle.
         """
         self._nodes: set[T] = set()
+        # Index of member nodes by (hashable) reference for O(1) lookups
+        self._nodes_by_reference: dict[Any, T] = {}
         self._topological_order: list[T] | None = None
         self._parallel_topological_order: list[set[T]] | None = None
+        # Filtered parallel orders, keyed by tag or caller-supplied cache key
+        self._filtered_parallel_orders: dict[Hashable, list[set[T]]] = {}
         self._checksum: str | None = None
+        self._edge_count: int | None = None
+        self._cpm: tuple[dict[T, dict[str, float]], float] | None = None
 
         if initial:
-            for node in initial:
-                self.add_node(node)
+            # One walk over everything reachable replaces a cycle search per node;
+            # only if it finds a cycle do the per-node checks run to report it.
+            # Materialize first: both passes read the nodes, and initial may be
+            # a one-shot iterator.
+            nodes = tuple(initial)
+            trusted = not _reaches_cycle(nodes)
+            for node in nodes:
+                self.add_node(node, _trusted=trusted)
 
             if discover:
                 self.discover()
@@ -57,25 +116,22 @@ class Graph[T: Graphable[Any]]:
         Returns:
             Graph[T]: A new Graph instance.
         """
-        import copy
-
         logger.debug(f"Cloning graph (include_edges={include_edges}).")
-        node_map: dict[T, T] = {}
-        for node in self._nodes:
-            new_node = copy.copy(node)
-            # Reset internal edge tracking
-            new_node._dependents = {}
-            new_node._depends_on = {}
-            # Manually clone tags to avoid shared state
-            new_node._tags = set(node.tags)
-            node_map[node] = new_node
+        node_map: dict[T, T] = {node: node._shallow_clone() for node in self._nodes}
 
         new_graph = Graph(set(node_map.values()))
 
         if include_edges:
-            for u in self._nodes:
-                for v, attrs in self.neighbors(u, Direction.DOWN):
-                    new_graph.add_edge(node_map[u], node_map[v], **attrs)
+            # The source edges are already acyclic and consistent, so link the
+            # copies directly instead of re-checking each edge in add_edge
+            members = self._nodes
+            for u in members:
+                new_u = node_map[u]
+                for v, attrs in u._dependents.items():
+                    if v in members:
+                        new_v = node_map[v]
+                        new_u._add_dependent(new_v, **attrs)
+                        new_v._add_depends_on(new_u, **attrs)
 
         return new_graph
 
@@ -92,15 +148,16 @@ class Graph[T: Graphable[Any]]:
         Yields:
             tuple[T, dict[str, Any]]: A (neighbor_node, edge_attributes) tuple.
         """
-        neighbors = node.dependents if direction == Direction.DOWN else node.depends_on
-        for neighbor in neighbors:
-            if neighbor in self._nodes:
-                attrs = (
-                    node.edge_attributes(neighbor)
-                    if direction == Direction.DOWN
-                    else neighbor.edge_attributes(node)
-                )
-                yield neighbor, attrs
+        members = self._nodes
+        # Iterate snapshots so callers may change edges between steps
+        if direction == Direction.DOWN:
+            for neighbor, attrs in tuple(node._dependents.items()):
+                if neighbor in members:
+                    yield neighbor, attrs
+        else:
+            for neighbor in tuple(node._depends_on):
+                if neighbor in members:
+                    yield neighbor, neighbor.edge_attributes(node)
 
     def internal_dependents(self, node: T) -> Iterator[tuple[T, dict[str, Any]]]:
         """Alias for neighbors(node, Direction.DOWN)."""
@@ -118,23 +175,43 @@ class Graph[T: Graphable[Any]]:
         logger.debug(f"Discovering reachable nodes from {len(self._nodes)} base nodes.")
 
         new_nodes: set[T] = set()
-        for node in list(self._nodes):
-            new_nodes.update(
-                self._traverse(node, direction=Direction.UP, limit_to_graph=False)
-            )
-            new_nodes.update(
-                self._traverse(node, direction=Direction.DOWN, limit_to_graph=False)
-            )
+        for attr in ("depends_on", "dependents"):
+            neighbors_of = attrgetter(attr)
+            # One walk per direction from all members at once; a node reached
+            # from several base nodes is expanded only the first time
+            seen: set[T] = set(self._nodes)
+            stack = list(self._nodes)
+            while stack:
+                for neighbor in neighbors_of(stack.pop()):
+                    if neighbor not in seen:
+                        seen.add(neighbor)
+                        new_nodes.add(neighbor)
+                        stack.append(neighbor)
+
+        if not new_nodes:
+            return
+
+        # Insert in bulk, then validate once. The new nodes are closed under
+        # ancestors/descendants, so any cycle through them lies among members.
+        for node in new_nodes:
+            self._nodes.add(node)
+            self._index_reference(node)
+            node._register_observer(self)
+        self._invalidate_cache()
 
         for node in new_nodes:
-            self.add_node(node)
+            self._check_node_consistency(node)
+        self.check_cycles()
 
     def _invalidate_cache(self) -> None:
         """Clear all cached calculations for this graph."""
         logger.debug("Invalidating graph cache.")
         self._topological_order = None
         self._parallel_topological_order = None
+        self._filtered_parallel_orders.clear()
         self._checksum = None
+        self._edge_count = None
+        self._cpm = None
 
     def __contains__(self, item: object) -> bool:
         """
@@ -149,7 +226,11 @@ class Graph[T: Graphable[Any]]:
         if isinstance(item, Graphable):
             return item in self._nodes
 
-        return any(node.reference == item for node in self._nodes)
+        try:
+            self._lookup_reference(item)
+        except KeyError:
+            return False
+        return True
 
     def __getitem__(self, reference: Any) -> T:
         """
@@ -164,11 +245,56 @@ class Graph[T: Graphable[Any]]:
         Raises:
             KeyError: If no node with the given reference exists.
         """
-        for node in self._nodes:
-            if node.reference == reference:
+        return self._lookup_reference(reference)
+
+    def _lookup_reference(self, reference: Any) -> T:
+        """
+        Find a member node by reference, using the reference index when possible.
+        Falls back to a linear scan for references that could not be indexed
+        (unhashable or duplicated references).
+
+        Args:
+            reference (Any): The reference object to search for.
+
+        Returns:
+            T: The Graphable node.
+
+        Raises:
+            KeyError: If no node with the given reference exists.
+        """
+        try:
+            if (node := self._nodes_by_reference.get(reference)) is not None:
                 return node
+        except TypeError:
+            pass
+
+        if len(self._nodes_by_reference) < len(self._nodes):
+            for node in self._nodes:
+                if node.reference == reference:
+                    return node
         raise KeyError(f"No node found with reference: {reference}")
 
+    def _index_reference(self, node: T) -> None:
+        """Add a member node to the reference index if its reference is hashable."""
+        try:
+            self._nodes_by_reference.setdefault(node.reference, node)
+        except TypeError:
+            pass
+
+    def _unindex_reference(self, node: T) -> None:
+        """Remove a node from the reference index, re-indexing any duplicate."""
+        try:
+            if self._nodes_by_reference.get(node.reference) is not node:
+                return
+        except TypeError:
+            return
+
+        del self._nodes_by_reference[node.reference]
+        for other in self._nodes:
+            if other is not node and other.reference == node.reference:
+                self._nodes_by_reference[other.reference] = other
+                break
+
     def __iter__(self):
         """
         Iterate over nodes in topological order.
@@ -181,6 +307,24 @@ class Graph[T: Graphable[Any]]:
         """
         return len(self._nodes)
 
+    @property
+    def edge_count(self) -> int:
+        """
+        Get the number of edges between member nodes.
+        The count is cached until the graph or one of its nodes changes.
+
+        Returns:
+            int: The number of internal edges.
+        """
+        if self._edge_count is None:
+            self._edge_count = sum(
+                1
+                for node in self._nodes
+                for dependent in node._dependents
+                if dependent in self._nodes
+            )
+        return self._edge_count
+
     def is_equal_to(self, other: object) -> bool:
         """
         Check if this graph is equal to another graph.
@@ -192,8 +336,13 @@ class Graph[T: Graphable[Any]]:
         Returns:
             bool: True if equal, False otherwise.
         """
+        if self is other:
+            return True
         if not isinstance(other, Graph):
             return False
+        # Graphs with different node counts cannot match; skip hashing both
+        if len(self._nodes) != len(other._nodes):
+            return False
 
         return self.checksum() == other.checksum()
 
@@ -209,32 +358,48 @@ class Graph[T: Graphable[Any]]:
         if self._checksum is not None:
             return self._checksum
 
+        members = self._nodes
+        # str() of each reference, computed once and reused as the sort key for
+        # both the nodes and every edge list
+        ref_str = {n: str(n.reference) for n in members}
+        ref_key = ref_str.__getitem__
+
         # 1. Sort nodes by reference to ensure deterministic iteration
-        sorted_nodes = sorted(self._nodes, key=lambda n: str(n.reference))
+        sorted_nodes = sorted(members, key=ref_key)
 
-        hasher = blake2b()
+        # Integrity digest, not a security primitive
+        hasher = blake2b(usedforsecurity=False)
+        # Fields are collected and hashed in batches; concatenating them feeds
+        # the hasher exactly the same bytes as one update() per field
+        parts: list[str] = []
+        append = parts.append
 
         for node in sorted_nodes:
             # 2. Add node reference, duration, and status
-            hasher.update(str(node.reference).encode())
-            hasher.update(f":duration:{node.duration}".encode())
-            hasher.update(f":status:{node.status}".encode())
+            append(ref_str[node])
+            append(f":duration:{node.duration}")
+            append(f":status:{node.status}")
 
             # 3. Add sorted tags
-            for tag in sorted(node.tags):
-                hasher.update(f":tag:{tag}".encode())
+            for tag in node.sorted_tags:
+                append(f":tag:{tag}")
 
             # 4. Add sorted dependents (edges) with attributes - Only those in the graph
+            dependents = node._dependents
             internal_dependents = sorted(
-                [d for d in node.dependents if d in self._nodes],
-                key=lambda n: str(n.reference),
+                (d for d in dependents if d in members), key=ref_key
             )
             for dep in internal_dependents:
-                hasher.update(f":edge:{dep.reference}".encode())
+                append(f":edge:{dep.reference}")
                 # Add edge attributes deterministically
-                attrs = node.edge_attributes(dep)
-                for key in sorted(attrs.keys()):
-                    hasher.update(f":attr:{key}:{attrs[key]}".encode())
+                for key, value in sorted(dependents[dep].items()):
+                    append(f":attr:{key}:{value}")
+
+            if len(parts) >= _CHECKSUM_BATCH:
+                hasher.update("".join(parts).encode())
+                parts.clear()
+
+        hasher.update("".join(parts).encode())
 
         self._checksum = hasher.hexdigest()
         return self._checksum
@@ -261,8 +426,14 @@ class Graph[T: Graphable[Any]]:
         p = Path(path)
         digest = self.checksum()
         logger.info(f"Writing checksum to: {p}")
-        with open(p, "w+") as f:
-            f.write(digest)
+        # Write next to the target and swap it in, so readers never see a partial file
+        tmp = p.with_name(f"{p.name}.tmp")
+        try:
+            tmp.write_text(digest)
+            tmp.replace(p)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
 
     @staticmethod
     def read_checksum(path: Path | str) -> str:
@@ -345,22 +516,34 @@ class Graph[T: Graphable[Any]]:
             list[set[T]]: A list of sets of member nodes that have no unmet dependencies.
         """
         if self._parallel_topological_order is None:
-            logger.debug("Calculating parallel topological order.")
-            self._parallel_topological_order = []
-            sorter = TopologicalSorter({node: node.depends_on for node in self._nodes})
-            sorter.prepare()
-            while sorter.is_active():
-                ready = sorter.get_ready()
-                if not ready:
-                    break
-                # Filter to only include nodes that are actually in this graph
-                filtered_ready = {node for node in ready if node in self._nodes}
-                if filtered_ready:
-                    self._parallel_topological_order.append(filtered_ready)
-                sorter.done(*ready)
+            self._sort()
 
         return self._parallel_topological_order
 
+    def map_layers[R](
+        self, fn: Callable[[T], R], executor: Executor | None = None
+    ) -> dict[T, R]:
+        """
+        Apply a function to every node, one parallel topological layer at a time.
+        Each layer is fully processed before the next one starts, so a node is only
+        processed after all of its dependencies.
+
+        Args:
+            fn (Callable[[T], R]): The function to apply to each node.
+            executor (Executor | None): Executor used to run the nodes of a layer
+                concurrently (e.g., a ThreadPoolExecutor). If None, nodes are
+                processed sequentially in the calling thread.
+
+        Returns:
+            dict[T, R]: A mapping of each node to its result.
+        """
+        results: dict[T, R] = {}
+        for layer in self.parallelized_topological_order():
+            nodes = list(layer)
+            mapped = executor.map(fn, nodes) if executor else map(fn, nodes)
+            results.update(zip(nodes, mapped))
+        return results
+
     def subgraph_between(self, source: T, target: T) -> Graph[T]:
         """
         Create a new graph containing all nodes and edges on all paths between source and target.
@@ -375,13 +558,41 @@ class Graph[T: Graphable[Any]]:
         if source not in self._nodes or target not in self._nodes:
             raise KeyError("Both source and target must be in the graph.")
 
-        # Nodes between U and V are nodes that are descendants of U AND ancestors of V
-        descendants = {source} | set(self.descendants(source))
-        ancestors = {target} | set(self.ancestors(target))
-        between = descendants & ancestors
+        # Nodes between U and V are nodes that are descendants of U AND ancestors of V.
+        # Every node on such a path is a descendant of U, so the upward walk from V
+        # can stay inside U's descendants.
+        descendants = self._reachable(source, Direction.DOWN, self._nodes)
+        between = self._reachable(target, Direction.UP, descendants)
 
         return Graph(between)
 
+    def _reachable(self, start: T, direction: Direction, within: set[T]) -> set[T]:
+        """
+        Collect the nodes reachable from start without leaving a given node set.
+
+        Args:
+            start (T): The node to start from.
+            direction: Direction.UP for dependencies, Direction.DOWN for dependents.
+            within (set[T]): The nodes the walk may visit.
+
+        Returns:
+            set[T]: start (if in within) and every node reached from it.
+        """
+        if start not in within:
+            return set()
+
+        neighbors_of = attrgetter(
+            "dependents" if direction == Direction.DOWN else "depends_on"
+        )
+        reached: set[T] = {start}
+        stack = [start]
+        while stack:
+            for neighbor in neighbors_of(stack.pop()):
+                if neighbor not in reached and neighbor in within:
+                    reached.add(neighbor)
+                    stack.append(neighbor)
+        return reached
+
     def diff_graph(self, other: Graph[T]) -> Graph[T]:
         """
         Create a visualization-friendly diff graph.
@@ -393,86 +604,73 @@ class Graph[T: Graphable[Any]]:
         Returns:
             Graph[T]: A merged graph with diff metadata.
         """
-        import copy
-
         merged_nodes_map: dict[Any, T] = {}
         diff_info = self.diff(other)
+        added_nodes = diff_info["added_nodes"]
+        removed_nodes = diff_info["removed_nodes"]
+        modified_nodes = diff_info["modified_nodes"]
+        added_edges = diff_info["added_edges"]
+        removed_edges = diff_info["removed_edges"]
+        modified_edges = diff_info["modified_edges"]
 
         def get_or_create(node: T, status: str) -> T:
             ref = node.reference
             if ref not in merged_nodes_map:
-                new_node = copy.copy(node)
-                new_node._dependents = {}
-                new_node._depends_on = {}
+                new_node = node._shallow_clone()
                 new_node.add_tag(f"diff:{status}")
                 # Add visual hints
-                color = {"added": "green", "removed": "red", "modified": "orange"}.get(
-                    status, "grey"
-                )
-                new_node.add_tag(f"color:{color}")
+                new_node.add_tag(f"color:{_DIFF_COLORS.get(status, 'grey')}")
                 merged_nodes_map[ref] = new_node
             return merged_nodes_map[ref]
 
         # Add all nodes from both
         for node in self._nodes:
-            status = (
-                "removed"
-                if node.reference in diff_info["removed_nodes"]
-                else "unchanged"
-            )
-            if node.reference in diff_info["modified_nodes"]:
+            ref = node.reference
+            if ref in modified_nodes:
                 status = "modified"
+            else:
+                status = "removed" if ref in removed_nodes else "unchanged"
             get_or_create(node, status)
 
         for node in other._nodes:
-            status = (
-                "added" if node.reference in diff_info["added_nodes"] else "unchanged"
-            )
-            if node.reference in diff_info["modified_nodes"]:
+            ref = node.reference
+            if ref in modified_nodes:
                 status = "modified"
+            else:
+                status = "added" if ref in added_nodes else "unchanged"
             get_or_create(node, status)
 
         new_graph = Graph(set(merged_nodes_map.values()))
 
         # Add edges from self (original)
-        for u in self._nodes:
-            for v in u.dependents:
-                if v not in self._nodes:
+        members = self._nodes
+        for u in members:
+            mu = merged_nodes_map[u.reference]
+            for v, attrs in u._dependents.items():
+                if v not in members:
                     continue
+                mv = merged_nodes_map[v.reference]
                 edge = (u.reference, v.reference)
-                if edge in diff_info["removed_edges"]:
+                if edge in removed_edges:
+                    new_graph.add_edge(mu, mv, diff_status="removed", color="red")
+                elif edge in modified_edges:
                     new_graph.add_edge(
-                        merged_nodes_map[u.reference],
-                        merged_nodes_map[v.reference],
-                        diff_status="removed",
-                        color="red",
-                    )
-                elif edge in diff_info["modified_edges"]:
-                    new_graph.add_edge(
-                        merged_nodes_map[u.reference],
-                        merged_nodes_map[v.reference],
-                        **u.edge_attributes(v),
-                        diff_status="modified",
-                        color="orange",
+                        mu, mv, **attrs, diff_status="modified", color="orange"
                     )
                 else:
-                    new_graph.add_edge(
-                        merged_nodes_map[u.reference],
-                        merged_nodes_map[v.reference],
-                        **u.edge_attributes(v),
-                    )
+                    new_graph.add_edge(mu, mv, **attrs)
 
         # Add edges from other (new)
-        for u in other._nodes:
-            for v in u.dependents:
-                if v not in other._nodes:
+        members = other._nodes
+        for u in members:
+            for v, attrs in u._dependents.items():
+                if v not in members:
                     continue
-                edge = (u.reference, v.reference)
-                if edge in diff_info["added_edges"]:
+                if (u.reference, v.reference) in added_edges:
                     new_graph.add_edge(
                         merged_nodes_map[u.reference],
                         merged_nodes_map[v.reference],
-                        **u.edge_attributes(v),
+                        **attrs,
                         diff_status="added",
                         color="green",
                     )
@@ -487,13 +685,8 @@ class Graph[T: Graphable[Any]]:
         Returns:
             Graph[T]: A new Graph instance representing the transitive closure.
         """
-        import copy
-
         logger.debug("Calculating transitive closure.")
-        node_map = {node: copy.copy(node) for node in self._nodes}
-        for n in node_map.values():
-            n._dependents = {}
-            n._depends_on = {}
+        node_map = {node: node._shallow_clone() for node in self._nodes}
 
         new_graph = Graph(set(node_map.values()))
         for u in self._nodes:
@@ -520,44 +713,62 @@ class Graph[T: Graphable[Any]]:
         nodes = list(self._nodes)
         # We can try to be slightly smarter by using a DFS and finding back-edges
         back_edges = []
-        visited = set()
-        stack = set()
-
-        def dfs(u):
-            visited.add(u)
-            stack.add(u)
-            for v in u.dependents:
-                if v not in self._nodes:
-                    continue
-                if v in stack:
-                    back_edges.append((u, v))
-                elif v not in visited:
-                    dfs(v)
-            stack.remove(u)
+        members = self._nodes
+        # DFS colors: absent = unvisited, _ON_STACK = being explored, _DONE = finished
+        color: dict[T, int] = {}
 
         for node in nodes:
-            if node not in visited:
-                dfs(node)
+            if node in color:
+                continue
+            # Iterative DFS; each frame is a node and its remaining dependents
+            color[node] = _ON_STACK
+            frames = [(node, iter(node.dependents))]
+            while frames:
+                u, it = frames[-1]
+                v = next(it, None)
+                if v is None:
+                    frames.pop()
+                    color[u] = _DONE
+                    continue
+                if v not in members:
+                    continue
+                state = color.get(v)
+                if state is None:
+                    color[v] = _ON_STACK
+                    frames.append((v, iter(v.dependents)))
+                elif state == _ON_STACK:
+                    back_edges.append((u, v))
 
         return back_edges
 
     def parallelized_topological_order_filtered(
-        self, fn: Callable[[T], bool]
+        self, fn: Callable[[T], bool], cache_key: Hashable | None = None
     ) -> list[set[T]]:
         """
         Get a filtered list of nodes in parallelized topological order.
 
         Args:
             fn (Callable[[T], bool]): The predicate function.
+            cache_key (Hashable | None): If given, the result is cached under this key
+                until the graph or one of its nodes changes. The predicate must
+                only depend on graph and node state for the cache to stay valid.
 
         Returns:
             list[set[T]]: Filtered sets of nodes for parallel processing.
         """
+        if cache_key is not None:
+            cached = self._filtered_parallel_orders.get(cache_key)
+            if cached is not None:
+                return cached
+
         result = []
         for group in self.parallelized_topological_order():
             filtered_group = {node for node in group if fn(node)}
             if filtered_group:
                 result.append(filtered_group)
+
+        if cache_key is not None:
+            self._filtered_parallel_orders[cache_key] = result
         return result
 
     def parallelized_topological_order_tagged(self, tag: str) -> list[set[T]]:
@@ -570,7 +781,9 @@ class Graph[T: Graphable[Any]]:
         Returns:
             list[set[T]]: Tagged sets of nodes for parallel processing.
         """
-        return self.parallelized_topological_order_filtered(lambda n: n.is_tagged(tag))
+        return self.parallelized_topological_order_filtered(
+            lambda n: n.is_tagged(tag), cache_key=("tagged", tag)
+        )
 
     def __eq__(self, other: object) -> bool:
         """
@@ -592,9 +805,15 @@ class Graph[T: Graphable[Any]]:
         Raises:
             GraphCycleError: If a cycle is detected.
         """
+        # A cached order proves the graph has stayed acyclic: every edge change
+        # on a member node invalidates it
+        if self._topological_order is not None:
+            return
+
         try:
-            sorter = TopologicalSorter({node: node.depends_on for node in self._nodes})
-            sorter.prepare()
+            # Sorting raises on a cycle; otherwise it leaves both orders cached
+            # for the views that usually follow a check
+            self._sort()
         except CycleError as e:
             # graphlib.CycleError args: (message, cycle_tuple)
             cycle = list(e.args[1]) if len(e.args) > 1 else None
@@ -675,12 +894,43 @@ class Graph[T: Graphable[Any]]:
         # Invalidate cache
         self._invalidate_cache()
 
-    def add_node(self, node: T) -> bool:
+    def add_edges_from(self, edges: Iterable[tuple[Any, ...]]) -> None:
+        """
+        Add multiple directed edges to the graph in one call.
+
+        Args:
+            edges: An iterable of (node, dependent) or (node, dependent, attributes)
+                tuples, where attributes is a dict of edge attributes.
+
+        Raises:
+            GraphCycleError: If adding any of the edges would create a cycle.
+            ValueError: If an edge is not a 2- or 3-tuple, or its attributes are not
+                a mapping.
+        """
+        for edge in edges:
+            if len(edge) == 2:
+                node, dependent = edge
+                attributes: Mapping[str, Any] = {}
+            elif len(edge) == 3:
+                node, dependent, attributes = edge
+                if not isinstance(attributes, Mapping):
+                    raise ValueError(
+                        f"Edge attributes must be a mapping, got {type(attributes).__name__}."
+                    )
+            else:
+                raise ValueError(
+                    f"Expected a (node, dependent[, attributes]) tuple, got {len(edge)} items."
+                )
+            self.add_edge(node, dependent, **attributes)
+
+    def add_node(self, node: T, _trusted: bool = False) -> bool:
         """
         Add a node to the graph.
 
         Args:
             node (T): The node to add.
+            _trusted (bool): Internal. Skip the cycle search when the caller has
+                already ruled out cycles through this node.
 
         Returns:
             bool: True if the node was added (was not already present), False otherwise.
@@ -693,13 +943,14 @@ class Graph[T: Graphable[Any]]:
 
         # If the node is already part of a cycle (linked externally), adding it might be invalid
         # if we want to enforce DAG.
-        if cycle := node.find_path(node):
+        if not _trusted and (cycle := node.find_path(node)):
             raise GraphCycleError(
                 f"Node '{node.reference}' is part of an existing cycle.", cycle=cycle
             )
 
         self._check_node_consistency(node)
         self._nodes.add(node)
+        self._index_reference(node)
         node._register_observer(self)
         logger.debug(f"Added node: {node.reference}")
 
@@ -730,14 +981,8 @@ class Graph[T: Graphable[Any]]:
             node (T): The node to remove.
         """
         if node in self._nodes:
-            # Remove from all nodes it depends on
-            for dep in list(node.depends_on):
-                dep._remove_dependent(node)
-
-            # Remove from all nodes that depend on it
-            for sub in list(node.dependents):
-                sub._remove_depends_on(node)
-
+            node._detach()
+            self._unindex_reference(node)
             self._nodes.remove(node)
             node._unregister_observer(self)
             logger.debug(f"Removed node: {node.reference}")
@@ -785,30 +1030,28 @@ class Graph[T: Graphable[Any]]:
         Yields:
             T: Each reached node in breadth-first order.
         """
-        from collections import deque
-
         if limit_to_graph and start_node not in self._nodes:
             return
 
+        neighbors_of = attrgetter(
+            "dependents" if direction == Direction.DOWN else "depends_on"
+        )
         visited: set[T] = {start_node}
-        queue: deque[T] = deque([start_node])
+        # The queue holds neighbor snapshots taken before each node is yielded,
+        # so callers may change edges (or remove the node) between steps
+        queue: deque[tuple[T, ...]] = deque([tuple(neighbors_of(start_node))])
 
         yield start_node
 
         while queue:
-            current = queue.popleft()
-            neighbors = (
-                current.dependents
-                if direction == Direction.DOWN
-                else current.depends_on
-            )
-            for neighbor in neighbors:
+            for neighbor in queue.popleft():
                 if neighbor not in visited:
                     if limit_to_graph and neighbor not in self._nodes:
                         continue
                     visited.add(neighbor)
+                    snapshot = tuple(neighbors_of(neighbor))
                     yield neighbor
-                    queue.append(neighbor)
+                    queue.append(snapshot)
 
     def dfs(
         self,
@@ -859,21 +1102,27 @@ class Graph[T: Graphable[Any]]:
             if not limit_to_graph or start_node in self._nodes:
                 yield start_node
 
-        def discover(current: T) -> Iterator[T]:
-            neighbors = (
-                current.dependents
-                if direction == Direction.DOWN
-                else current.depends_on
-            )
-            for neighbor in neighbors:
-                if neighbor not in visited:
-                    if limit_to_graph and neighbor not in self._nodes:
-                        continue
-                    visited.add(neighbor)
-                    yield neighbor
-                    yield from discover(neighbor)
-
-        yield from discover(start_node)
+        neighbors_of = attrgetter(
+            "dependents" if direction == Direction.DOWN else "depends_on"
+        )
+        # Explicit stack of neighbor iterators: same pre-order as a recursive
+        # walk, without a generator frame per level of depth. Each iterator runs
+        # over a snapshot taken before its node is yielded, so callers may change
+        # edges (or remove the node) between steps.
+        stack: list[Iterator[T]] = [iter(tuple(neighbors_of(start_node)))]
+        while stack:
+            neighbor = next(stack[-1], None)
+            if neighbor is None:
+                stack.pop()
+                continue
+            if neighbor in visited:
+                continue
+            if limit_to_graph and neighbor not in self._nodes:
+                continue
+            visited.add(neighbor)
+            snapshot = iter(tuple(neighbors_of(neighbor)))
+            yield neighbor
+            stack.append(snapshot)
 
     @property
     def sinks(self) -> list[T]:
@@ -1020,41 +1269,73 @@ class Graph[T: Graphable[Any]]:
                 - 'LF': Latest Finish
                 - 'slack': Total Slack (LF - EF)
         """
+        analysis, _ = self._cpm_result()
+        return {node: dict(vals) for node, vals in analysis.items()}
+
+    def cpm_analysis_with_duration(self) -> tuple[dict[T, dict[str, float]], float]:
+        """
+        Perform CPM analysis and report the total project duration in the same pass.
+
+        Returns:
+            tuple[dict[T, dict[str, float]], float]: The CPM values per node (see
+                cpm_analysis) and the project duration (the maximum Earliest Finish).
+        """
+        analysis, duration = self._cpm_result()
+        return {node: dict(vals) for node, vals in analysis.items()}, duration
+
+    def _cpm_result(self) -> tuple[dict[T, dict[str, float]], float]:
+        """
+        Get the cached CPM values and project duration, computing them if needed.
+        The result is shared; public callers get copies.
+
+        Returns:
+            tuple[dict[T, dict[str, float]], float]: As cpm_analysis_with_duration.
+        """
+        if self._cpm is not None:
+            return self._cpm
+
         logger.debug("Starting CPM analysis.")
         topo_order = self.topological_order()
         if not topo_order:
-            return {}
+            return {}, 0.0
 
-        analysis: dict[T, dict[str, float]] = {
-            node: {"ES": 0.0, "EF": 0.0, "LS": 0.0, "LF": 0.0, "slack": 0.0}
-            for node in topo_order
-        }
+        # Work on flat per-node floats and assemble the result dicts at the end.
+        es: dict[T, float] = {}
+        ef: dict[T, float] = {}
+        ls: dict[T, float] = {}
+        lf: dict[T, float] = {}
 
-        # 1. Forward Pass (ES, EF)
+        # 1. Forward Pass (ES, EF), tracking the project duration as we go
+        max_total_ef = 0.0
         for node in topo_order:
-            max_ef = 0.0
-            for dep in node.depends_on:
-                if dep in analysis:
-                    max_ef = max(max_ef, analysis[dep]["EF"])
-            analysis[node]["ES"] = max_ef
-            analysis[node]["EF"] = max_ef + node.duration
+            max_ef = max((ef[dep] for dep in node.depends_on if dep in ef), default=0.0)
+            finish = max_ef + node.duration
+            es[node] = max_ef
+            ef[node] = finish
+            if finish > max_total_ef:
+                max_total_ef = finish
 
         # 2. Backward Pass (LF, LS)
-        max_total_ef = max(analysis[node]["EF"] for node in topo_order)
-
         for node in reversed(topo_order):
-            if not node.dependents or all(d not in analysis for d in node.dependents):
-                min_ls = max_total_ef
-            else:
-                min_ls = min(
-                    analysis[dep]["LS"] for dep in node.dependents if dep in analysis
-                )
+            min_ls = min(
+                (ls[dep] for dep in node.dependents if dep in ls), default=max_total_ef
+            )
+            lf[node] = min_ls
+            ls[node] = min_ls - node.duration
 
-            analysis[node]["LF"] = min_ls
-            analysis[node]["LS"] = min_ls - node.duration
-            analysis[node]["slack"] = analysis[node]["LF"] - analysis[node]["EF"]
+        analysis: dict[T, dict[str, float]] = {
+            node: {
+                "ES": es[node],
+                "EF": ef[node],
+                "LS": ls[node],
+                "LF": lf[node],
+                "slack": lf[node] - ef[node],
+            }
+            for node in topo_order
+        }
 
-        return analysis
+        self._cpm = (analysis, max_total_ef)
+        return self._cpm
 
     def critical_path(self) -> list[T]:
         """
@@ -1063,7 +1344,7 @@ class Graph[T: Graphable[Any]]:
         Returns:
             list[T]: A list of nodes on the critical path, in topological order.
         """
-        analysis = self.cpm_analysis()
+        analysis, _ = self._cpm_result()
         return [
             node
             for node in self.topological_order()
@@ -1081,13 +1362,14 @@ class Graph[T: Graphable[Any]]:
         # This is a bit more complex than just critical_path() if there are multiple critical paths.
         # But for dependency graphs, any path where slack == 0 is "a" longest path.
         # To get a specific chain:
-        analysis = self.cpm_analysis()
-        cp_nodes = {
+        analysis, _ = self._cpm_result()
+        # The analysis is keyed in topological order, so this list is too
+        cp_order = [
             node for node, vals in analysis.items() if abs(vals["slack"]) < 1e-9
-        }
-
-        if not cp_nodes:
+        ]
+        if not cp_order:
             return []
+        cp_nodes = set(cp_order)
 
         # Find a source on critical path
         current = None
@@ -1098,9 +1380,7 @@ class Graph[T: Graphable[Any]]:
 
         if current is None:
             # Fallback: just take the first CP node in topo order
-            current = sorted(
-                list(cp_nodes), key=lambda n: self.topological_order().index(n)
-            )[0]
+            current = cp_order[0]
 
         path = [current]
         while True:
@@ -1131,20 +1411,41 @@ class Graph[T: Graphable[Any]]:
         Returns:
             list[list[T]]: A list of all paths, where each path is a list of nodes.
         """
+        return list(self._iter_paths(source, target))
+
+    def _iter_paths(self, source: T, target: T) -> Iterator[list[T]]:
+        """
+        Yield every path between two nodes, depth-first.
+        One shared path list grows and shrinks with the search; only complete
+        paths are copied.
+
+        Args:
+            source (T): Starting node.
+            target (T): Ending node.
 
-        def find_all_paths(current: T, goal: T, path: list[T]) -> list[list[T]]:
-            path = path + [current]
-            if current == goal:
-                return [path]
-            paths = []
-            for neighbor in current.dependents:
-                if neighbor in self._nodes:
-                    new_paths = find_all_paths(neighbor, goal, path)
-                    for p in new_paths:
-                        paths.append(p)
-            return paths
+        Yields:
+            list[T]: Each path, as a list of nodes.
+        """
+        if source == target:
+            yield [source]
+            return
 
-        return find_all_paths(source, target, [])
+        members = self._nodes
+        path = [source]
+        stack = [iter(source._dependents)]
+        while stack:
+            for neighbor in stack[-1]:
+                if neighbor not in members:
+                    continue
+                if neighbor == target:
+                    yield path + [neighbor]
+                    continue
+                path.append(neighbor)
+                stack.append(iter(neighbor._dependents))
+                break
+            else:
+                stack.pop()
+                path.pop()
 
     def diff(self, other: Graph[T]) -> dict[str, Any]:
         """
@@ -1216,15 +1517,39 @@ class Graph[T: Graphable[Any]]:
             list[T]: A list of member nodes sorted topologically.
         """
         if self._topological_order is None:
-            logger.debug("Calculating topological order.")
-            sorter = TopologicalSorter({node: node.depends_on for node in self._nodes})
-            # Filter the static order to only include nodes that are in this graph
-            self._topological_order = [
-                node for node in sorter.static_order() if node in self._nodes
-            ]
+            self._sort()
 
         return self._topological_order
 
+    def _sort(self) -> None:
+        """
+        Sort the graph once and cache both the flat and the layered topological order.
+        The flat order is the layers concatenated, which is exactly what
+        TopologicalSorter.static_order() yields.
+
+        Raises:
+            CycleError: If the graph contains a cycle.
+        """
+        logger.debug("Calculating topological order.")
+        members = self._nodes
+        sorter = TopologicalSorter({node: node.depends_on for node in members})
+        sorter.prepare()
+        order: list[T] = []
+        layers: list[set[T]] = []
+        while sorter.is_active():
+            ready = sorter.get_ready()
+            if not ready:
+                break
+            # Filter to only include nodes that are actually in this graph
+            layer = [node for node in ready if node in members]
+            if layer:
+                order.extend(layer)
+                layers.append(set(layer))
+            sorter.done(*ready)
+
+        self._topological_order = order
+        self._parallel_topological_order = layers
+
     def topological_order_filtered(self, fn: Callable[[T], bool]) -> list[T]:
         """
         Get a filtered list of nodes in topological order.
@@ -1261,50 +1586,85 @@ class Graph[T: Graphable[Any]]:
 
         return to_networkx(self)
 
+    def _reduced_dependents(self) -> dict[T, list[T]]:
+        """
+        Compute the dependents each node keeps in the transitive reduction.
+
+        Returns:
+            dict[T, list[T]]: The non-redundant dependents of every member node.
+        """
+        # An edge (u, v) is redundant if there exists a path from u to v of length > 1,
+        # i.e. if v is reachable from another dependent of u. Reachability is kept as
+        # one int bitmask per node (bit i = i-th node in topological order), so
+        # visiting nodes sinks-first turns each reachability set into a few big-int
+        # ORs instead of a DFS over the descendants.
+        order = self.topological_order()
+        bit: dict[T, int] = {node: 1 << i for i, node in enumerate(order)}
+        reach: dict[T, int] = {}
+        reduced: dict[T, list[T]] = {}
+        for u in reversed(order):
+            direct = 0
+            through = 0
+            for w in u.dependents:
+                direct |= bit.get(w, 0)
+                through |= reach.get(w, 0)
+
+            reduced[u] = [v for v in u.dependents if not through & bit.get(v, 0)]
+            reach[u] = direct | through
+
+        return reduced
+
+    def remove_redundant_edges(self) -> None:
+        """
+        Apply the transitive reduction to this DAG in place.
+        Every edge implied by a longer path is removed, without cloning any nodes.
+        """
+        logger.debug("Removing redundant edges.")
+
+        removed = 0
+        for u, keep in self._reduced_dependents().items():
+            if len(keep) == len(u.dependents):
+                continue
+            kept = set(keep)
+            for v in [v for v in u.dependents if v not in kept]:
+                u._remove_dependent(v)
+                v._remove_depends_on(u)
+                removed += 1
+
+        if removed:
+            self._invalidate_cache()
+        logger.info(f"Removed {removed} redundant edges.")
+
     def transitive_reduction(self) -> Graph[T]:
         """
         Compute the transitive reduction of this DAG.
         A transitive reduction of a directed acyclic graph G is a graph G' with the same nodes
         and the same reachability as G, but with as few edges as possible.
+        Use remove_redundant_edges() to reduce this graph in place instead.
 
         Returns:
             Graph[T]: A new Graph instance containing the same nodes (cloned) but with redundant edges removed.
         """
-        import copy
-
         logger.debug("Calculating transitive reduction.")
 
         # 1. Clone nodes without edges to avoid modifying the original graph.
-        node_map: dict[T, T] = {}
-        for node in self._nodes:
-            new_node = copy.copy(node)
-            # Reset internal edge tracking
-            new_node._dependents = {}
-            new_node._depends_on = {}
-            # Manually clone tags to avoid shared state
-            new_node._tags = set(node.tags)
-            node_map[node] = new_node
-
-        # 2. Identify redundant edges.
-        # An edge (u, v) is redundant if there exists a path from u to v of length > 1.
-        redundant_edges: set[tuple[T, T]] = set()
-        for u in self._nodes:
-            for v in u.dependents:
-                # Check if v is reachable from u through any other neighbor w.
-                if any(w.find_path(v) for w in u.dependents if w != v):
-                    redundant_edges.add((u, v))
+        node_map: dict[T, T] = {node: node._shallow_clone() for node in self._nodes}
+
+        # 2. Identify the edges to keep.
+        reduced = self._reduced_dependents()
 
         # 3. Construct the new graph with non-redundant edges.
         new_graph = Graph(set(node_map.values()))
+        kept = 0
         for u in self._nodes:
-            for v in u.dependents:
-                if (u, v) not in redundant_edges:
-                    # Preserve edge attributes
-                    attrs = u.edge_attributes(v)
-                    new_graph.add_edge(node_map[u], node_map[v], **attrs)
+            for v in reduced[u]:
+                # Preserve edge attributes
+                attrs = u.edge_attributes(v)
+                new_graph.add_edge(node_map[u], node_map[v], **attrs)
+                kept += 1
 
         logger.info(
-            f"Transitive reduction complete. Removed {len(redundant_edges)} redundant edges."
+            f"Transitive reduction complete. Removed {self.edge_count - kept} redundant edges."
         )
         return new_graph
 
@@ -1346,8 +1706,6 @@ class Graph[T: Graphable[Any]]:
             embed_checksum: If True, embed the graph's checksum as a comment at the top.
             **kwargs: Additional arguments passed to the export function.
         """
-        from pathlib import Path
-
         from .registry import CREATOR_MAP
         from .views.utils import wrap_with_checksum
 
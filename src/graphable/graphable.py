@@ -1,4 +1,5 @@
 from collections import deque
+from collections.abc import KeysView
 from logging import getLogger
 from typing import Any, Protocol, Self, cast, runtime_checkable
 from weakref import WeakSet
@@ -23,6 +24,18 @@ class Graphable[T]:
         T: The type of the reference object this node holds.
     """
 
+    __slots__ = (
+        "__weakref__",
+        "_dependents",
+        "_depends_on",
+        "_duration",
+        "_observers",
+        "_reference",
+        "_sorted_tags",
+        "_status",
+        "_tags",
+    )
+
     def __init__(self, reference: T):
         """
         Initialize a Graphable node.
@@ -34,6 +47,7 @@ class Graphable[T]:
         self._depends_on: dict[Graphable[Any], dict[str, Any]] = {}
         self._reference: T = reference
         self._tags: set[str] = set()
+        self._sorted_tags: tuple[str, ...] | None = None
         self._observers: WeakSet[GraphObserver] = WeakSet()
         self._duration: float = 0.0
         self._status: str = "pending"
@@ -52,6 +66,37 @@ class Graphable[T]:
         """Unregister an observer."""
         self._observers.discard(observer)
 
+    def _shallow_clone(self) -> Self:
+        """
+        Create an unlinked copy of this node.
+
+        The copy shares the reference, duration and status, gets its own tag set,
+        and starts with no edges and no observers.
+
+        Returns:
+            Self: The new node.
+        """
+        cls = type(self)
+        clone = cls.__new__(cls)
+        clone._dependents = {}
+        clone._depends_on = {}
+        clone._reference = self._reference
+        clone._tags = set(self._tags)
+        clone._sorted_tags = self._sorted_tags
+        clone._observers = WeakSet()
+        clone._duration = self._duration
+        clone._status = self._status
+        if cls is not Graphable:
+            # Carry over any state a subclass keeps in its own slots or __dict__
+            for base in cls.__mro__[: cls.__mro__.index(Graphable)]:
+                slots = base.__dict__.get("__slots__", ())
+                for name in (slots,) if isinstance(slots, str) else slots:
+                    if name not in ("__dict__", "__weakref__") and hasattr(self, name):
+                        setattr(clone, name, getattr(self, name))
+            if hasattr(self, "__dict__"):
+                clone.__dict__.update(self.__dict__)
+        return clone
+
     @property
     def duration(self) -> float:
         """Get the duration of this node."""
@@ -291,6 +336,21 @@ class Graphable[T]:
             )
             self._notify_change()
 
+    def _detach(self) -> None:
+        """
+        Internal method to remove every edge to and from this node, on both sides.
+        """
+        for dep in self._depends_on:
+            dep._dependents.pop(self, None)
+            dep._notify_change()
+        for sub in self._dependents:
+            sub._depends_on.pop(self, None)
+            sub._notify_change()
+        self._depends_on.clear()
+        self._dependents.clear()
+        logger.debug(f"Node '{self.reference}': detached from all neighbors")
+        self._notify_change()
+
     def _register_observer(self, observer: GraphObserver) -> None:
         """Register an observer to be notified of changes."""
         self._observers.add(observer)
@@ -307,26 +367,49 @@ class Graphable[T]:
             tag (str): The tag to add.
         """
         self._tags.add(tag)
+        self._sorted_tags = None
         logger.debug(f"Added tag '{tag}' to {self.reference}")
         self._notify_change()
 
     @property
-    def dependents(self) -> set[Self]:
+    def dependents(self) -> KeysView[Self]:
         """
-        Get the set of nodes that depend on this node.
+        Get the nodes that depend on this node.
 
         Returns:
-            set[Self]: A copy of the dependents set.
+            KeysView[Self]: A live, read-only view of the dependents.
+                Use copy_dependents() for a snapshot that can be modified
+                or that stays stable while edges are changed.
         """
-        return cast(set[Self], set(self._dependents))
+        return cast(KeysView[Self], self._dependents.keys())
 
     @property
-    def depends_on(self) -> set[Self]:
+    def depends_on(self) -> KeysView[Self]:
+        """
+        Get the nodes that this node depends on.
+
+        Returns:
+            KeysView[Self]: A live, read-only view of the dependencies.
+                Use copy_depends_on() for a snapshot that can be modified
+                or that stays stable while edges are changed.
         """
-        Get the set of nodes that this node depends on.
+        return cast(KeysView[Self], self._depends_on.keys())
+
+    def copy_dependents(self) -> set[Self]:
+        """
+        Get a snapshot of the nodes that depend on this node.
+
+        Returns:
+            set[Self]: A new set that is safe to modify or iterate while edges change.
+        """
+        return cast(set[Self], set(self._dependents))
+
+    def copy_depends_on(self) -> set[Self]:
+        """
+        Get a snapshot of the nodes that this node depends on.
 
         Returns:
-            set[Self]: A copy of the dependencies set.
+            set[Self]: A new set that is safe to modify or iterate while edges change.
         """
         return cast(set[Self], set(self._depends_on))
 
@@ -469,6 +552,19 @@ class Graphable[T]:
         """
         return set(self._tags)
 
+    @property
+    def sorted_tags(self) -> tuple[str, ...]:
+        """
+        Get the tags for this node in sorted order.
+        The result is cached until a tag is added or removed.
+
+        Returns:
+            tuple[str, ...]: The sorted tags.
+        """
+        if self._sorted_tags is None:
+            self._sorted_tags = tuple(sorted(self._tags))
+        return self._sorted_tags
+
     def remove_tag(self, tag: str) -> None:
         """
         Remove a tag from this node.
@@ -478,5 +574,6 @@ class Graphable[T]:
         """
         if tag in self._tags:
             self._tags.discard(tag)
+            self._sorted_tags = None
             logger.debug(f"Removed tag '{tag}' from {self.reference}")
             self._notify_change()
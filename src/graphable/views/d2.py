@@ -89,9 +89,16 @@ def create_topology_d2(graph: Graph, config: D2StylingConfig | None = None) -> s
         sorted_tags = config.tag_sort_fnc(node.tags)
         return sorted_tags[0] if sorted_tags else None
 
+    # Node identifiers are needed for every node and again for every edge end,
+    # so compute each one once.
+    topo_order = graph.topological_order()
+    refs: dict[Graphable[Any], str] = {
+        node: config.node_ref_fnc(node) for node in topo_order
+    }
+
     # Group nodes by cluster
     clusters: dict[str | None, list[Graphable[Any]]] = {}
-    for node in graph.topological_order():
+    for node in topo_order:
         cluster = get_cluster(node)
         if cluster not in clusters:
             clusters[cluster] = []
@@ -105,7 +112,7 @@ def create_topology_d2(graph: Graph, config: D2StylingConfig | None = None) -> s
             indent = "  "
 
         for node in nodes:
-            node_ref = config.node_ref_fnc(node)
+            node_ref = refs[node]
             node_label = config.node_label_fnc(node)
             d2.append(f"{indent}{node_ref}: {node_label}")
 
@@ -117,14 +124,14 @@ def create_topology_d2(graph: Graph, config: D2StylingConfig | None = None) -> s
             d2.append("}")
 
     # Edges
-    for node in graph.topological_order():
-        node_ref = config.node_ref_fnc(node)
+    for node in topo_order:
+        node_ref = refs[node]
         for dependent, _ in graph.internal_dependents(node):
             # If nodes are in clusters, D2 handles flat references or nested references.
             # Usually, if IDs are unique, flat references work.
             # But if we wanted to be explicit: cluster.node_ref
             # For now, let's assume node_ref is globally unique (the default is reference string).
-            edge_line = f"{node_ref} -> {config.node_ref_fnc(dependent)}"
+            edge_line = f"{node_ref} -> {refs[dependent]}"
 
             if config.edge_style_fnc:
                 edge_styles = config.edge_style_fnc(node, dependent)
@@ -68,9 +68,16 @@ def create_topology_graphml(
     # Create graph element
     graph_elem = ET.SubElement(root, "graph", {"id": "G", "edgedefault": "directed"})
 
+    # Node identifiers are needed for every node and again for every edge end,
+    # so compute each one once.
+    topo_order = graph.topological_order()
+    refs: dict[Graphable[Any], str] = {
+        node: config.node_ref_fnc(node) for node in topo_order
+    }
+
     # Nodes
-    for node in graph.topological_order():
-        node_id = config.node_ref_fnc(node)
+    for node in topo_order:
+        node_id = refs[node]
         node_elem = ET.SubElement(graph_elem, "node", {"id": node_id})
 
         # Add tags as data
@@ -80,7 +87,7 @@ def create_topology_graphml(
 
         # Edges
         for dependent, _ in graph.internal_dependents(node):
-            dep_id = config.node_ref_fnc(dependent)
+            dep_id = refs[dependent]
             ET.SubElement(
                 graph_elem,
                 "edge",
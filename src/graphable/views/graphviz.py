@@ -96,9 +96,16 @@ def create_topology_graphviz_dot(
         sorted_tags = config.tag_sort_fnc(node.tags)
         return sorted_tags[0] if sorted_tags else None
 
+    # Node identifiers are needed for every node and again for every edge end,
+    # so compute each one once.
+    topo_order = graph.topological_order()
+    refs: dict[Graphable[Any], str] = {
+        node: _escape_dot_string(config.node_ref_fnc(node)) for node in topo_order
+    }
+
     # Group nodes by cluster
     clusters: dict[str | None, list[Graphable[Any]]] = {}
-    for node in graph.topological_order():
+    for node in topo_order:
         cluster = get_cluster(node)
         if cluster not in clusters:
             clusters[cluster] = []
@@ -114,7 +121,7 @@ def create_topology_graphviz_dot(
             indent = "        "
 
         for node in nodes:
-            node_ref = _escape_dot_string(config.node_ref_fnc(node))
+            node_ref = refs[node]
             node_attrs = {"label": config.node_label_fnc(node)}
             if config.node_attr_fnc:
                 node_attrs.update(config.node_attr_fnc(node))
@@ -125,15 +132,17 @@ def create_topology_graphviz_dot(
             dot.append("    }")
 
     # Edges
-    for node in graph.topological_order():
-        node_ref = _escape_dot_string(config.node_ref_fnc(node))
+    for node in topo_order:
+        node_ref = refs[node]
         for dependent, attrs in graph.internal_dependents(node):
-            dep_ref = _escape_dot_string(config.node_ref_fnc(dependent))
-            edge_attrs = {}
-            if config.edge_attr_fnc:
-                edge_attrs.update(config.edge_attr_fnc(node, dependent))
-
-            dot.append(f'    "{node_ref}" -> "{dep_ref}"{_format_attrs(edge_attrs)};')
+            dep_ref = refs[dependent]
+            edge_attrs = (
+                _format_attrs(config.edge_attr_fnc(node, dependent))
+                if config.edge_attr_fnc
+                else ""
+            )
+
+            dot.append(f'    "{node_ref}" -> "{dep_ref}"{edge_attrs};')
 
     dot.append("}")
     return "\n".join(dot)
@@ -1,11 +1,10 @@
 from atexit import register as on_script_exit
 from dataclasses import dataclass
 from functools import cache
+from hashlib import blake2b
 from logging import getLogger
 from pathlib import Path
-from shlex import quote
-from shutil import which
-from string import Template
+from shutil import copyfile, which
 from subprocess import PIPE, CalledProcessError, run
 from tempfile import NamedTemporaryFile
 from typing import Any, Callable
@@ -17,12 +16,18 @@ from ..registry import register_view
 logger = getLogger(__name__)
 
 _MERMAID_CONFIG_JSON: str = '{ "htmlLabels": false }'
-_MMDC_SCRIPT_TEMPLATE: Template = Template("""
-#!/bin/env bash
-/bin/env mmdc -c $mermaid_config -i $source -o $output -p $puppeteer_config
-""")
 _PUPPETEER_CONFIG_JSON: str = '{ "args": [ "--no-sandbox" ] }'
 
+# Rendered images keyed by a hash of their mermaid source and format. Each entry
+# remembers where the image was written and its mtime, so a stale or deleted
+# file is never reused.
+_IMAGE_CACHE: dict[str, tuple[Path, int]] = {}
+_IMAGE_CACHE_SIZE: int = 128
+
+
+def _node_reference_text(node: Graphable[Any]) -> str:
+    return str(node.reference)
+
 
 def _get_node_style(node: Graphable[Any]) -> str | None:
     for tag in node.tags:
@@ -54,8 +59,8 @@ class MermaidStylingConfig:
         link_style_default: Default style string for links (or None).
     """
 
-    node_ref_fnc: Callable[[Graphable[Any]], str] = lambda n: str(n.reference)
-    node_text_fnc: Callable[[Graphable[Any]], str] = lambda n: str(n.reference)
+    node_ref_fnc: Callable[[Graphable[Any]], str] = _node_reference_text
+    node_text_fnc: Callable[[Graphable[Any]], str] = _node_reference_text
     node_style_fnc: Callable[[Graphable[Any]], str | None] | None = _get_node_style
     node_style_default: str | None = None
     link_text_fnc: Callable[[Graphable[Any], Graphable[Any]], str] = lambda n, sn: "-->"
@@ -89,34 +94,56 @@ def _cleanup_on_exit(path: Path) -> None:
         path.unlink()
 
 
-def _create_mmdc_script(mmdc_script_content: str) -> Path:
-    """Create a temporary shell script for executing mmdc."""
-    with NamedTemporaryFile(delete=False, mode="w+", suffix=".sh") as f:
-        f.write(mmdc_script_content)
-        mmdc_script: Path = Path(f.name)
-    logger.debug(f"Created temporary mmdc script: {mmdc_script}")
-    return mmdc_script
+def _image_cache_key(mermaid: str, suffix: str) -> str:
+    """Hash mermaid source together with the target image format."""
+    digest = blake2b(mermaid.encode(), digest_size=16, usedforsecurity=False)
+    digest.update(suffix.lower().encode())
+    return digest.hexdigest()
 
 
-def create_mmdc_script_content(source: Path, output: Path) -> str:
+def _reuse_cached_image(key: str, output: Path) -> bool:
     """
-    Generate the bash script content to run mmdc.
+    Copy a previously rendered image to output if one is still valid.
 
     Args:
-        source (Path): Path to the source mermaid file.
-        output (Path): Path to the output file.
+        key (str): The image cache key.
+        output (Path): Where the image should be written.
 
     Returns:
-        str: The script content.
+        bool: True if a cached image was reused, False otherwise.
     """
-    mmdc_script_content: str = _MMDC_SCRIPT_TEMPLATE.substitute(
-        mermaid_config=quote(str(_write_mermaid_config())),
-        output=quote(str(output)),
-        puppeteer_config=quote(str(_write_puppeteer_config())),
-        source=quote(str(source)),
-    )
+    if (entry := _IMAGE_CACHE.get(key)) is None:
+        return False
+
+    cached, mtime = entry
+    try:
+        stale = cached.stat().st_mtime_ns != mtime
+        if not stale and cached.resolve() != output.resolve():
+            copyfile(cached, output)
+    except OSError:
+        stale = True
+
+    if stale:
+        del _IMAGE_CACHE[key]
+        return False
+
+    # Move the entry to the end so the least recently used one is evicted first
+    _IMAGE_CACHE[key] = _IMAGE_CACHE.pop(key)
+    logger.debug(f"Reused cached mermaid image {cached} for {output}")
+    return True
+
+
+def _remember_image(key: str, output: Path) -> None:
+    """Record a freshly rendered image in the image cache."""
+    try:
+        mtime = output.stat().st_mtime_ns
+    except OSError:
+        return
 
-    return mmdc_script_content
+    _IMAGE_CACHE.pop(key, None)
+    _IMAGE_CACHE[key] = (output, mtime)
+    while len(_IMAGE_CACHE) > _IMAGE_CACHE_SIZE:
+        del _IMAGE_CACHE[next(iter(_IMAGE_CACHE))]
 
 
 def _escape_mermaid_string(s: str) -> str:
@@ -141,27 +168,36 @@ def create_topology_mermaid_mmd(
     """
     config = config or MermaidStylingConfig()
 
-    def link_style(node: Graphable[Any], subnode: Graphable[Any]) -> str | None:
-        if config.link_style_fnc:
-            return config.link_style_fnc(node, subnode)
-        return None
-
-    def node_style(node: Graphable[Any]) -> str | None:
-        if config.node_style_fnc and (style := config.node_style_fnc(node)):
-            return style
-        return config.node_style_default
-
     def get_cluster(node: Graphable[Any]) -> str | None:
         if not config.cluster_by_tag or not node.tags:
             return None
         sorted_tags = config.tag_sort_fnc(node.tags)
         return sorted_tags[0] if sorted_tags else None
 
+    # Resolve the styling hooks once rather than per node and per edge
+    node_style_fnc = config.node_style_fnc
+    node_style_default = config.node_style_default
+    link_text_fnc = config.link_text_fnc
+    link_style_fnc = config.link_style_fnc
+
     mermaid: list[str] = ["flowchart TD"]
 
+    # Node identifiers are needed for every node and again for every edge end,
+    # so compute each one once.
+    topo_order = graph.topological_order()
+    refs: dict[Graphable[Any], str] = {
+        node: config.node_ref_fnc(node) for node in topo_order
+    }
+    # By default the label is the identifier, so reuse it instead of calling again
+    texts: dict[Graphable[Any], str] = (
+        refs
+        if config.node_text_fnc is config.node_ref_fnc
+        else {node: config.node_text_fnc(node) for node in topo_order}
+    )
+
     # Group nodes by cluster
     clusters: dict[str | None, list[Graphable[Any]]] = {}
-    for node in graph.topological_order():
+    for node in topo_order:
         cluster = get_cluster(node)
         if cluster not in clusters:
             clusters[cluster] = []
@@ -175,11 +211,11 @@ def create_topology_mermaid_mmd(
             indent = "  "
 
         for node in nodes:
-            node_ref = config.node_ref_fnc(node)
-            node_text = _escape_mermaid_string(config.node_text_fnc(node))
+            node_ref = refs[node]
+            node_text = _escape_mermaid_string(texts[node])
             mermaid.append(f"{indent}{node_ref}[{node_text}]")
 
-            if style := node_style(node):
+            if style := (node_style_fnc and node_style_fnc(node)) or node_style_default:
                 mermaid.append(f"{indent}style {node_ref} {style}")
 
         if cluster_name:
@@ -187,14 +223,12 @@ def create_topology_mermaid_mmd(
 
     # Render edges
     link_num: int = 0
-    for node in graph.topological_order():
-        node_ref = config.node_ref_fnc(node)
+    for node in topo_order:
+        node_ref = refs[node]
         for subnode, _ in graph.internal_dependents(node):
-            subnode_ref = config.node_ref_fnc(subnode)
-            mermaid.append(
-                f"{node_ref} {config.link_text_fnc(node, subnode)} {subnode_ref}"
-            )
-            if style := link_style(node, subnode):
+            subnode_ref = refs[subnode]
+            mermaid.append(f"{node_ref} {link_text_fnc(node, subnode)} {subnode_ref}")
+            if link_style_fnc and (style := link_style_fnc(node, subnode)):
                 mermaid.append(f"linkStyle {link_num} {style}")
             link_num += 1
 
@@ -204,19 +238,30 @@ def create_topology_mermaid_mmd(
     return "\n".join(mermaid)
 
 
-def _execute_build_script(build_script: Path) -> bool:
+def _execute_mmdc(source: Path, output: Path) -> bool:
     """
-    Execute the build script.
+    Run mmdc to render a mermaid source file.
 
     Args:
-        build_script (Path): Path to the script.
+        source (Path): Path to the source mermaid file.
+        output (Path): Path to the output file.
 
     Returns:
         bool: True if execution succeeded, False otherwise.
     """
     try:
         run(
-            ["/bin/env", "bash", build_script],
+            [
+                "mmdc",
+                "-c",
+                str(_write_mermaid_config()),
+                "-i",
+                str(source),
+                "-o",
+                str(output),
+                "-p",
+                str(_write_puppeteer_config()),
+            ],
             check=True,
             stderr=PIPE,
             stdout=PIPE,
@@ -224,9 +269,9 @@ def _execute_build_script(build_script: Path) -> bool:
         )
         return True
     except CalledProcessError as e:
-        logger.error(f"Error executing {build_script}: {e.stderr}")
+        logger.error(f"Error executing mmdc: {e.stderr}")
     except FileNotFoundError:
-        logger.error("Could not execute script: file not found.")
+        logger.error("Could not execute mmdc: file not found.")
     return False
 
 
@@ -256,6 +301,8 @@ def export_topology_mermaid_image(
 ) -> None:
     """
     Export the graph to an image file (SVG or PNG) using mmdc.
+    Rendering identical mermaid source to the same format again copies the
+    previously rendered image instead of running mmdc.
 
     Args:
         graph (Graph): The graph to export.
@@ -274,19 +321,20 @@ def export_topology_mermaid_image(
 
         mermaid = wrap_with_checksum(mermaid, graph.checksum(), ".mmd")
 
+    key = _image_cache_key(mermaid, p.suffix)
+    if _reuse_cached_image(key, p):
+        logger.info(f"Successfully exported SVG to {output}")
+        return
+
     with NamedTemporaryFile(delete=False, mode="w+", suffix=".mmd") as f:
         f.write(mermaid)
         source: Path = Path(f.name)
 
     logger.debug(f"Created temporary mermaid source file: {source}")
 
-    build_script: Path = _create_mmdc_script(
-        create_mmdc_script_content(source=source, output=p)
-    )
-
-    if _execute_build_script(build_script):
-        build_script.unlink()
+    if _execute_mmdc(source, p):
         source.unlink()
+        _remember_image(key, p)
         logger.info(f"Successfully exported SVG to {output}")
     else:
         logger.error(f"Failed to export SVG to {output}")
@@ -64,9 +64,16 @@ def create_topology_plantuml(
         sorted_tags = config.tag_sort_fnc(node.tags)
         return sorted_tags[0] if sorted_tags else None
 
+    # Node identifiers are needed for every node and again for every edge end,
+    # so compute each one once.
+    topo_order = graph.topological_order()
+    refs: dict[Graphable[Any], str] = {
+        node: config.node_ref_fnc(node) for node in topo_order
+    }
+
     # Group nodes by cluster
     clusters: dict[str | None, list[Graphable[Any]]] = {}
-    for node in graph.topological_order():
+    for node in topo_order:
         cluster = get_cluster(node)
         if cluster not in clusters:
             clusters[cluster] = []
@@ -80,7 +87,7 @@ def create_topology_plantuml(
             indent = "  "
 
         for node in nodes:
-            node_ref = config.node_ref_fnc(node)
+            node_ref = refs[node]
             node_label = config.node_label_fnc(node)
             puml.append(f'{indent}{config.node_type} "{node_label}" as {node_ref}')
 
@@ -88,11 +95,10 @@ def create_topology_plantuml(
             puml.append("}")
 
     # Edges
-    for node in graph.topological_order():
-        node_ref = config.node_ref_fnc(node)
+    for node in topo_order:
+        node_ref = refs[node]
         for dependent, _ in graph.internal_dependents(node):
-            dep_ref = config.node_ref_fnc(dependent)
-            puml.append(f"{node_ref} --> {dep_ref}")
+            puml.append(f"{node_ref} --> {refs[dependent]}")
 
     puml.append("@enduml")
     return "\n".join(puml)
@@ -42,68 +42,37 @@ def create_topology_tree_txt(
 
     logger.debug("Creating topology tree text.")
 
-    def create_topology_subtree_txt(
-        node: Graphable[Any],
-        indent: str = "",
-        is_last: bool = True,
-        is_root: bool = True,
-        visited: set[Graphable[Any]] | None = None,
-    ) -> str:
-        """
-        Recursively generate the text representation for a subtree.
-
-        Args:
-            node (Graphable): The current node being processed.
-            indent (str): The current indentation string.
-            is_last (bool): Whether this node is the last sibling.
-            is_root (bool): Whether this is the root of the (sub)tree.
-            visited (set[Graphable] | None): Set of already visited nodes to detect cycles/redundancy.
-
-        Returns:
-            str: The text representation of the subtree.
-        """
-        if visited is None:
-            visited = set[Graphable]()
-        already_seen: bool = node in visited
-
-        subtree: list[str] = []
-        if is_root:
-            subtree.append(f"{indent}{config.node_text_fnc(node)}")
-
-            next_indent: str = indent
-
-        else:
-            marker: str = "└─ " if is_last else "├─ "
-            suffix: str = " (see above)" if already_seen and node.depends_on else ""
-            subtree.append(f"{indent}{marker}{config.node_text_fnc(node)}{suffix}")
-
-            next_indent: str = indent + ("   " if is_last else "│  ")
-
-        if already_seen:
-            return "\n".join(subtree)
-        visited.add(node)
-
-        internal_deps = list(graph.internal_depends_on(node))
-        for i, (subnode, _) in enumerate(internal_deps, start=1):
-            subtree.append(
-                create_topology_subtree_txt(
-                    node=subnode,
-                    indent=next_indent,
-                    is_last=(i == len(internal_deps)),
-                    is_root=False,
-                    visited=visited,
-                )
-            )
-
-        return "\n".join(subtree)
-
     tree: list[str] = []
-    for node in graph.sinks:
-        tree.append(
-            create_topology_subtree_txt(
-                node=node, indent=config.initial_indent, is_root=True
-            )
-        )
+    for sink in graph.sinks:
+        # Each sink starts a fresh depth-first walk over its dependencies.
+        # Stack entries are (node, indent, is_last, is_root); children are pushed
+        # in reverse so they are emitted in their natural order.
+        visited: set[Graphable[Any]] = set()
+        stack: list[tuple[Graphable[Any], str, bool, bool]] = [
+            (sink, config.initial_indent, True, True)
+        ]
+        while stack:
+            node, indent, is_last, is_root = stack.pop()
+            already_seen: bool = node in visited
+
+            if is_root:
+                tree.append(f"{indent}{config.node_text_fnc(node)}")
+                next_indent: str = indent
+            else:
+                marker: str = "└─ " if is_last else "├─ "
+                suffix: str = " (see above)" if already_seen and node.depends_on else ""
+                tree.append(f"{indent}{marker}{config.node_text_fnc(node)}{suffix}")
+                next_indent = indent + ("   " if is_last else "│  ")
+
+            if already_seen:
+                continue
+            visited.add(node)
+
+            internal_deps = [subnode for subnode, _ in graph.internal_depends_on(node)]
+            last = len(internal_deps)
+            for i in range(last, 0, -1):
+                stack.append((internal_deps[i - 1], next_indent, i == last, False))
+
     return "\n".join(tree)
 
 
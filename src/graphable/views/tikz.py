@@ -44,35 +44,41 @@ def create_topology_tikz(graph: Graph, config: TikzStylingConfig | None = None)
     config = config or TikzStylingConfig()
     lines: list[str] = [r"\begin{tikzpicture}"]
 
+    # Node identifiers are needed for every node and again for every edge end,
+    # so compute each one once.
+    topo_order = graph.topological_order()
+    refs: dict[Graphable[Any], str] = {
+        node: config.node_ref_fnc(node) for node in topo_order
+    }
+
     if config.use_graphs_lib:
         lines.append(r"  \usetikzlibrary{graphs}")
         lines.append("  \\graph [nodes={" + config.node_options + "}] {")
 
         # Define nodes and edges in graph syntax
-        for node in graph.topological_order():
-            node_ref = config.node_ref_fnc(node)
+        for node in topo_order:
+            node_ref = refs[node]
             node_label = config.node_label_fnc(node)
             # TikZ graph syntax: alias/Label
             lines.append(f'    {node_ref} ["{node_label}"];')
 
             for dependent, _ in graph.internal_dependents(node):
-                dep_ref = config.node_ref_fnc(dependent)
-                lines.append(f"    {node_ref} -> {dep_ref};")
+                lines.append(f"    {node_ref} -> {refs[dependent]};")
 
         lines.append("  };")
     else:
         # Standard TikZ syntax (simplified placement)
-        for i, node in enumerate(graph.topological_order()):
-            node_ref = config.node_ref_fnc(node)
+        for i, node in enumerate(topo_order):
+            node_ref = refs[node]
             node_label = config.node_label_fnc(node)
             lines.append(
                 f"  \\node[{config.node_options}] ({node_ref}) at (0,{-i * 1.5}) {{{node_label}}};"
             )
 
-        for node in graph.topological_order():
-            node_ref = config.node_ref_fnc(node)
+        for node in topo_order:
+            node_ref = refs[node]
             for dependent, _ in graph.internal_dependents(node):
-                dep_ref = config.node_ref_fnc(dependent)
+                dep_ref = refs[dependent]
                 lines.append(
                     f"  \\draw[{config.edge_options}] ({node_ref}) -- ({dep_ref});"
                 )
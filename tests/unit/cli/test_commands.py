@@ -32,6 +32,19 @@ def test_info_command(tmp_path):
     assert "B" in data["sinks"]
 
 
+def test_info_command_with_durations(tmp_path):
+    graph_file = tmp_path / "test.json"
+    graph_file.write_text(
+        '{"nodes": [{"id": "A", "duration": 3}, {"id": "B", "duration": 1}, '
+        '{"id": "C", "duration": 2}], "edges": [{"source": "A", "target": "B"}, '
+        '{"source": "A", "target": "C"}]}'
+    )
+
+    data = info_command(graph_file)
+    assert data["project_duration"] == 5.0
+    assert data["critical_path_length"] == 2
+
+
 def test_check_command(tmp_path):
     graph_file = tmp_path / "test.json"
     graph_file.write_text('{"nodes": [{"id": "A"}], "edges": []}')
@@ -0,0 +1,47 @@
+from unittest.mock import patch
+
+from pytest import raises
+
+from graphable.cli.main import app
+
+
+@patch("graphable.cli.bare_cli.run_bare")
+@patch("graphable.cli.rich_cli.app")
+def test_main_uses_rich_cli(mock_rich, mock_bare):
+    with patch("graphable.cli.main.argv", ["graphable", "info", "g.json"]):
+        app()
+    mock_rich.assert_called_once()
+    mock_bare.assert_not_called()
+
+
+@patch("graphable.cli.bare_cli.run_bare")
+@patch("graphable.cli.rich_cli.app")
+def test_main_bare_flag(mock_rich, mock_bare):
+    argv = ["graphable", "--bare", "info", "g.json"]
+    with patch("graphable.cli.main.argv", argv):
+        app()
+    assert argv == ["graphable", "info", "g.json"]
+    mock_bare.assert_called_once()
+    mock_rich.assert_not_called()
+
+
+@patch("graphable.cli.bare_cli.run_bare")
+@patch("graphable.cli.rich_cli.app")
+def test_main_bare_env(mock_rich, mock_bare):
+    with (
+        patch("graphable.cli.main.argv", ["graphable", "info", "g.json"]),
+        patch.dict("os.environ", {"GRAPHABLE_BARE": "1"}),
+    ):
+        app()
+    mock_bare.assert_called_once()
+    mock_rich.assert_not_called()
+
+
+@patch("graphable.cli.bare_cli.run_bare")
+@patch("graphable.cli.rich_cli.app")
+def test_main_command_import_error_not_masked(mock_rich, mock_bare):
+    mock_rich.side_effect = ImportError("broken command")
+    with patch("graphable.cli.main.argv", ["graphable", "info", "g.json"]):
+        with raises(ImportError, match="broken command"):
+            app()
+    mock_bare.assert_not_called()
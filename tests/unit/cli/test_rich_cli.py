@@ -222,6 +222,24 @@ def test_rich_cli_diff(mock_diff):
     assert "Modified Edges" in result.stdout
 
 
+@patch("graphable.cli.rich_cli.diff_command")
+def test_rich_cli_diff_truncates_long_rows(mock_diff):
+    """Verify that very long diff rows are cut short in Rich CLI."""
+    mock_diff.return_value = {
+        "added_nodes": [f"N{i}" for i in range(60)],
+        "removed_nodes": [],
+        "modified_nodes": [],
+        "added_edges": [],
+        "removed_edges": [],
+        "modified_edges": [],
+    }
+    result = runner.invoke(app, ["diff", "v1.json", "v2.json"])
+    assert result.exit_code == 0
+    assert "N49" in result.stdout
+    assert "N50" not in result.stdout
+    assert "(+10 more)" in result.stdout
+
+
 @patch("graphable.cli.rich_cli.diff_visual_command")
 def test_rich_cli_diff_visual(mock_diff_visual):
     """Verify diff command with output (visual) in Rich CLI."""
@@ -259,7 +277,7 @@ def test_rich_cli_diff_error(mock_diff):
     assert "Diff error" in result.stdout
 
 
-@patch("graphable.cli.rich_cli.serve_command")
+@patch("graphable.cli.commands.serve.serve_command")
 def test_rich_cli_serve(mock_serve):
     """Verify serve command in Rich CLI."""
     result = runner.invoke(app, ["serve", "test.json", "--port", "8080"])
@@ -268,7 +286,7 @@ def test_rich_cli_serve(mock_serve):
     mock_serve.assert_called_once_with(Path("test.json"), port=8080)
 
 
-@patch("graphable.cli.rich_cli.serve_command")
+@patch("graphable.cli.commands.serve.serve_command")
 def test_rich_cli_serve_error(mock_serve):
     """Verify serve command error handling in Rich CLI."""
     mock_serve.side_effect = Exception("Serve error")
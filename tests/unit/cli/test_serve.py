@@ -32,6 +32,25 @@ class TestServer:
         assert response.body == b"<html></html>"
         assert response.status_code == 200
 
+    @mark.anyio
+    @patch("graphable.cli.commands.serve.load_graph")
+    @patch("graphable.cli.commands.serve.create_topology_html")
+    async def test_index_reuses_page_until_change(self, mock_html, mock_load):
+        mock_load.return_value = MagicMock()
+        mock_html.return_value = "<html></html>"
+
+        server = Server(Path("test.json"))
+        await server.index(MagicMock())
+        response = await server.index(MagicMock())
+        assert mock_load.call_count == 1
+        assert response.body == b"<html></html>"
+        assert server._page == b"<html></html>"
+
+        # A file change drops the cached page
+        server._page = None
+        await server.index(MagicMock())
+        assert mock_load.call_count == 2
+
     @mark.anyio
     @patch("graphable.cli.commands.serve.load_graph")
     async def test_index_error(self, mock_load):
@@ -59,6 +78,21 @@ class TestServer:
         websocket.accept.assert_called_once()
         assert websocket not in server.connections
 
+    @mark.anyio
+    async def test_websocket_endpoint_already_dropped(self):
+        server = Server(Path("test.json"))
+        websocket = AsyncMock()
+
+        async def dropped_by_broadcast():
+            # A failed reload broadcast removes the socket before it disconnects
+            server.connections.discard(websocket)
+            raise Exception("Disconnect")
+
+        websocket.receive_text.side_effect = dropped_by_broadcast
+
+        await server.websocket_endpoint(websocket)
+        assert websocket not in server.connections
+
     @mark.anyio
     @patch("graphable.cli.commands.serve.awatch")
     async def test_watch_file(self, mock_awatch):
@@ -68,6 +102,7 @@ class TestServer:
         mock_awatch.return_value = mock_changes
 
         server = Server(Path("test.json"))
+        server._page = b"<html>stale</html>"
         ws = AsyncMock()
         server.connections.add(ws)
 
@@ -81,14 +116,33 @@ class TestServer:
             pass
 
         ws.send_text.assert_called_with("reload")
+        assert server._page is None
+
+    @mark.anyio
+    @patch("graphable.cli.commands.serve.awatch")
+    async def test_watch_file_drops_dead_connections(self, mock_awatch):
+        mock_changes = AsyncMock()
+        mock_changes.__aiter__.return_value = [[(1, "test.json")]]
+        mock_awatch.return_value = mock_changes
+
+        server = Server(Path("test.json"))
+        alive = AsyncMock()
+        dead = AsyncMock()
+        dead.send_text.side_effect = RuntimeError("closed")
+        server.connections.update({alive, dead})
+
+        await server.watch_file()
+
+        alive.send_text.assert_called_once_with("reload")
+        dead.send_text.assert_called_once_with("reload")
+        assert server.connections == {alive}
 
 
+@patch("graphable.cli.commands.serve.Server.watch_file", new_callable=AsyncMock)
 @patch("graphable.cli.commands.serve.UvicornServer")
 @patch("graphable.cli.commands.serve.Config")
-@patch("graphable.cli.commands.serve.get_event_loop")
-def test_serve_command(mock_loop, mock_config, mock_uv_server):
-    mock_loop_instance = MagicMock()
-    mock_loop.return_value = mock_loop_instance
+def test_serve_command(mock_config, mock_uv_server, mock_watch):
+    mock_uv_server.return_value.serve = AsyncMock()
 
     serve_command(Path("test.json"), port=1234, tag="v2")
 
@@ -96,5 +150,5 @@ def test_serve_command(mock_loop, mock_config, mock_uv_server):
     args, kwargs = mock_config.call_args
     assert kwargs["port"] == 1234
 
-    assert mock_loop_instance.create_task.called
-    assert mock_loop_instance.run_until_complete.called
+    mock_uv_server.return_value.serve.assert_awaited_once()
+    mock_watch.assert_called_once()
@@ -36,6 +36,30 @@ class TestGraph:
         assert b in a.dependents
         assert a in b.depends_on
 
+    def test_add_edges_from(self, nodes):
+        a, b, c = nodes
+        g = Graph()
+        g.add_edges_from([(a, b), (b, c, {"weight": 2})])
+
+        assert a in g
+        assert c in g
+        assert g.edge_count == 2
+        assert b.edge_attributes(c) == {"weight": 2}
+
+        with raises(GraphCycleError):
+            g.add_edges_from([(c, a)])
+
+    def test_add_edges_from_rejects_malformed_edges(self, nodes):
+        a, b, c = nodes
+        g = Graph()
+        with raises(ValueError, match="got 4 items"):
+            g.add_edges_from([(a, b, {}, {"weight": 1})])
+        with raises(ValueError, match="got 1 items"):
+            g.add_edges_from([(a,)])
+        with raises(ValueError, match="must be a mapping"):
+            g.add_edges_from([(a, b, "heavy")])
+        assert g.edge_count == 0
+
     def test_sinks_and_sources(self, nodes):
         a, b, c = nodes
         g = Graph()
@@ -157,6 +181,27 @@ class TestGraph:
         assert c3 != c1
         assert g._checksum == c3
 
+    def test_edge_count_caching(self, nodes):
+        a, b, c = nodes
+        g = Graph()
+        g.add_edge(a, b)
+
+        assert g.edge_count == 1
+        assert g._edge_count == 1
+
+        # Adding an edge invalidates the cached count
+        g.add_edge(b, c)
+        assert g._edge_count is None
+        assert g.edge_count == 2
+
+        # Edges to external nodes are not counted
+        d = Graphable("D")
+        c.add_dependent(d)
+        assert g.edge_count == 2
+
+        g.remove_node(a)
+        assert g.edge_count == 1
+
     def test_parallelized_topological_order_caching(self, nodes):
         a, b, _ = nodes
         a.add_dependent(b)
@@ -314,6 +359,28 @@ class TestGraph:
         c.add_tag("new-info")
         assert g._checksum is None
 
+    def test_discover_follows_each_direction_separately(self):
+        a, b, c, d = Graphable("A"), Graphable("B"), Graphable("C"), Graphable("D")
+        a.add_dependent(b)
+        c.add_dependent(b)
+        d.add_dependent(a)
+
+        # B's other parent C is neither an ancestor nor a descendant of A
+        g = Graph({a})
+        g.discover()
+        assert set(g) == {a, b, d}
+        assert g["D"] is d
+
+    def test_discover_rejects_cycles(self):
+        a, b, c = Graphable("A"), Graphable("B"), Graphable("C")
+        a.add_dependent(b)
+        g = Graph({a})
+        b.add_dependent(c)
+        c.add_dependent(b)
+
+        with raises(GraphCycleError):
+            g.discover()
+
     def test_add_edge_self_loop(self):
         a = Graphable("A")
         g = Graph()
@@ -381,6 +448,37 @@ class TestGraph:
             g.add_node(a)
         assert "existing cycle" in str(excinfo.value)
 
+    def test_init_with_existing_cycle(self):
+        a = Graphable("A")
+        b = Graphable("B")
+        c = Graphable("C")
+        a.requires(c)
+        b.requires(a)
+        a.requires(b)
+
+        # The cycle runs through B, which is not passed in
+        with raises(GraphCycleError) as excinfo:
+            Graph([a, c])
+        assert "existing cycle" in str(excinfo.value)
+
+    def test_init_from_iterator(self):
+        a, b = Graphable("A"), Graphable("B")
+        a.add_dependent(b)
+        g = Graph(iter([a, b]))
+        assert set(g) == {a, b}
+
+    def test_init_with_linked_nodes_skips_per_node_search(self):
+        a = Graphable("A")
+        b = Graphable("B")
+        c = Graphable("C")
+        b.requires(a)
+        c.requires(b)
+
+        with patch.object(Graphable, "find_path") as mock_find_path:
+            g = Graph([a, b, c])
+        mock_find_path.assert_not_called()
+        assert g.topological_order() == [a, b, c]
+
     def test_init_with_cycle(self):
         a = Graphable("A")
         b = Graphable("B")
@@ -403,6 +501,33 @@ class TestGraph:
         with raises(GraphCycleError):
             g.check_cycles()
 
+    def test_check_cycles_caches_topological_order(self):
+        a, b = Graphable("A"), Graphable("B")
+        g = Graph()
+        g.add_edge(a, b)
+        assert g._topological_order is None
+
+        g.check_cycles()
+        assert g._topological_order == [a, b]
+        assert g.topological_order() is g._topological_order
+        assert g._parallel_topological_order == [{a}, {b}]
+
+    def test_check_cycles_skips_while_order_cached(self):
+        a, b = Graphable("A"), Graphable("B")
+        g = Graph()
+        g.add_edge(a, b)
+        g.topological_order()
+
+        with patch("graphable.graph.TopologicalSorter") as mock_sorter:
+            g.check_cycles()
+        mock_sorter.assert_not_called()
+
+        # An edge change drops the cached order, so the next check runs again
+        b._add_dependent(a)
+        a._add_depends_on(b)
+        with raises(GraphCycleError):
+            g.check_cycles()
+
     def test_consistency_broken_depends_on(self):
         a, b = Graphable("A"), Graphable("B")
         a._add_depends_on(b)
@@ -455,6 +580,33 @@ class TestGraph:
         with raises(KeyError):
             _ = g["B"]
 
+    def test_container_reference_index(self, nodes):
+        a, b, _ = nodes
+        g = Graph()
+        g.add_node(a)
+        g.add_node(b)
+        assert g._nodes_by_reference == {"A": a, "B": b}
+
+        g.remove_node(a)
+        assert "A" not in g
+        assert g._nodes_by_reference == {"B": b}
+
+    def test_container_duplicate_and_unhashable_references(self):
+        first = Graphable("A")
+        second = Graphable("A")
+        unhashable = Graphable(["X"])
+        g = Graph()
+        g.add_node(first)
+        g.add_node(second)
+        g.add_node(unhashable)
+
+        assert g["A"] is first
+        assert g[["X"]] is unhashable
+        assert ["Y"] not in g
+
+        g.remove_node(first)
+        assert g["A"] is second
+
     def test_remove_edge(self, nodes):
         a, b, _ = nodes
         g = Graph()
@@ -471,6 +623,11 @@ class TestGraph:
         g.remove_node(b)
         assert b not in g
         assert b not in a.dependents
+        assert b not in c.depends_on
+        # The removed node keeps no one-sided edges behind
+        assert len(b.depends_on) == 0
+        assert len(b.dependents) == 0
+        g.check_consistency()
 
     def test_ancestors_descendants(self):
         a, b, c, d = Graphable("A"), Graphable("B"), Graphable("C"), Graphable("D")
@@ -491,6 +648,40 @@ class TestGraph:
         assert set(g.ancestors(d)) == {a, b, c}
         assert set(g.descendants(a)) == {b, c, d}
 
+    def test_descendants_deeper_than_recursion_limit(self):
+        chain = [Graphable(i) for i in range(3000)]
+        g = Graph()
+        for u, v in zip(chain, chain[1:]):
+            g.add_edge(u, v)
+        assert list(g.descendants(chain[0])) == chain[1:]
+        assert list(g.ancestors(chain[-1])) == chain[-2::-1]
+        assert g.suggest_cycle_breaks() == []
+        assert g.all_paths(chain[0], chain[-1]) == [chain]
+
+    def test_remove_nodes_while_traversing(self):
+        a, b, c, d = Graphable("A"), Graphable("B"), Graphable("C"), Graphable("D")
+        g = Graph()
+        g.add_edge(a, b)
+        g.add_edge(a, c)
+        g.add_edge(b, d)
+
+        for node in g.descendants(a):
+            g.remove_node(node)
+        assert set(g) == {a}
+
+        g.add_edge(a, b)
+        g.add_edge(b, c)
+        for node in g.bfs(a):
+            if node is not a:
+                g.remove_node(node)
+        assert set(g) == {a}
+
+        g.add_edge(a, b)
+        g.add_edge(a, c)
+        for node, _ in g.neighbors(a):
+            g.remove_edge(a, node)
+        assert len(a.dependents) == 0
+
     def test_upstream_downstream_of(self):
         a, b, c, d = Graphable("A"), Graphable("B"), Graphable("C"), Graphable("D")
         g = Graph()
@@ -549,6 +740,57 @@ class TestGraph:
         lp = g.longest_path()
         assert lp == [a, b, d]
 
+        analysis_fused, duration = g.cpm_analysis_with_duration()
+        assert analysis_fused == analysis
+        assert duration == 9
+
+    def test_cpm_analysis_cached(self):
+        a, b = Graphable("A"), Graphable("B")
+        a.duration = 2
+        b.duration = 3
+        g = Graph()
+        g.add_edge(a, b)
+
+        analysis = g.cpm_analysis()
+        assert g._cpm is not None
+        assert g.cpm_analysis() == analysis
+        assert g.critical_path() == [a, b]
+
+        # Callers get copies; changing one leaves the cached analysis intact
+        analysis[a]["ES"] = 100
+        g.cpm_analysis_with_duration()[0][b]["slack"] = 7
+        analysis.clear()
+        assert g.critical_path() == [a, b]
+        assert g.longest_path() == [a, b]
+        assert g.cpm_analysis()[a]["ES"] == 0
+
+        # A duration change on a member node drops the cached analysis
+        a.duration = 5
+        assert g.cpm_analysis_with_duration()[1] == 8
+
+        g.remove_node(b)
+        assert g.cpm_analysis_with_duration() == (
+            {a: {"ES": 0, "EF": 5, "LS": 0, "LF": 5, "slack": 0}},
+            5,
+        )
+
+    def test_longest_path_without_critical_source(self):
+        a, b, c = Graphable("A"), Graphable("B"), Graphable("C")
+        a.duration = 1
+        b.duration = 2
+        c.duration = 3
+        g = Graph()
+        g.add_edge(a, b)
+        g.add_edge(b, c)
+
+        # With no source to start from, the chain starts at the first critical
+        # node in topological order
+        with patch.object(Graph, "sources", new=[]):
+            assert g.longest_path() == [a, b, c]
+
+    def test_cpm_analysis_with_duration_empty(self):
+        assert Graph().cpm_analysis_with_duration() == ({}, 0.0)
+
     def test_all_paths(self):
         a = Graphable("A")
         b = Graphable("B")
@@ -564,6 +806,8 @@ class TestGraph:
         assert len(paths) == 2
         assert [a, b, d] in paths
         assert [a, c, d] in paths
+        assert g.all_paths(a, a) == [[a]]
+        assert g.all_paths(d, a) == []
 
     def test_suggest_cycle_breaks(self):
         a = Graphable("A")
@@ -604,6 +848,18 @@ class TestGraph:
         assert set(sub.topological_order()) == {a, b, c, d}
         assert e not in sub
 
+    def test_subgraph_between_excludes_side_branches(self):
+        a, b, c, x = [Graphable(n) for n in "ABCX"]
+        g = Graph()
+        g.add_edge(a, b)
+        g.add_edge(b, c)
+        # X feeds C but is not reachable from A
+        g.add_edge(x, c)
+
+        assert set(g.subgraph_between(a, c)) == {a, b, c}
+        assert set(g.subgraph_between(b, b)) == {b}
+        assert len(g.subgraph_between(c, a)) == 0
+
     def test_diff_graph(self):
         a1, b1 = Graphable("A"), Graphable("B")
         g1 = Graph()
@@ -664,6 +920,24 @@ class TestGraph:
         assert len(reduced["A"].dependents) == 2
         assert reduced["D"] not in reduced["A"].dependents
 
+    def test_remove_redundant_edges_in_place(self):
+        a, b, c, d = Graphable("A"), Graphable("B"), Graphable("C"), Graphable("D")
+        g = Graph()
+        g.add_edge(a, b)
+        g.add_edge(b, d)
+        g.add_edge(a, c, weight=3)
+        g.add_edge(c, d)
+        g.add_edge(a, d)
+        assert g.edge_count == 5
+
+        g.remove_redundant_edges()
+
+        assert g.edge_count == 4
+        assert d not in a.dependents
+        assert a not in d.depends_on
+        assert a.edge_attributes(c)["weight"] == 3
+        assert g["A"] is a
+
     def test_transitive_reduction_preserves_tags(self):
         a, b = Graphable("A"), Graphable("B")
         a.add_tag("important")
@@ -702,6 +976,36 @@ class TestGraph:
         g2.add_edge(a2, b2)
         assert g1.checksum() == g2.checksum()
 
+    def test_equality(self):
+        a1, b1 = Graphable("A"), Graphable("B")
+        g1 = Graph()
+        g1.add_edge(a1, b1)
+        a2, b2 = Graphable("A"), Graphable("B")
+        g2 = Graph()
+        g2.add_edge(a2, b2)
+
+        assert g1 == g2
+        assert g1 != "not a graph"
+
+        # Identity and differing sizes are decided without hashing
+        with patch.object(Graph, "checksum") as mock_checksum:
+            assert g1 == g1
+            g2.add_node(Graphable("C"))
+            assert g1 != g2
+        mock_checksum.assert_not_called()
+
+    def test_checksum_independent_of_batching(self):
+        a, b, c = Graphable("A"), Graphable("B"), Graphable("C")
+        a.add_tag("t")
+        g = Graph()
+        g.add_edge(a, b, weight=1)
+        g.add_edge(b, c)
+        batched = g.checksum()
+
+        g._checksum = None
+        with patch("graphable.graph._CHECKSUM_BATCH", 1):
+            assert g.checksum() == batched
+
     def test_parallelized_topological_order(self):
         a, b, c, d = Graphable("A"), Graphable("B"), Graphable("C"), Graphable("D")
         g = Graph()
@@ -738,6 +1042,28 @@ class TestGraph:
         digest = Graph.read_checksum(sum_file)
         assert digest == g.checksum()
 
+    def test_write_checksum_replaces_file(self, tmp_path):
+        g: Graph[Graphable[str]] = Graph()
+        g.add_node(Graphable("A"))
+        sum_file = tmp_path / "graph.blake2b"
+        sum_file.write_text("stale contents that are longer than a digest" * 10)
+
+        g.write_checksum(sum_file)
+        assert sum_file.read_text() == g.checksum()
+        assert [f.name for f in tmp_path.iterdir()] == ["graph.blake2b"]
+
+    def test_write_checksum_failure_keeps_old_file(self, tmp_path):
+        g: Graph[Graphable[str]] = Graph()
+        g.add_node(Graphable("A"))
+        sum_file = tmp_path / "graph.blake2b"
+        sum_file.write_text("old")
+
+        with patch("pathlib.Path.replace", side_effect=OSError("disk full")):
+            with raises(OSError):
+                g.write_checksum(sum_file)
+        assert sum_file.read_text() == "old"
+        assert [f.name for f in tmp_path.iterdir()] == ["graph.blake2b"]
+
     def test_embedded_checksum_io(self, tmp_path):
         a, b = Graphable("A"), Graphable("B")
         g: Graph[Graphable[str]] = Graph()
@@ -784,6 +1110,23 @@ class TestGraph:
         assert len(c2["A"].dependents) == 1
         assert c2["A"].edge_attributes(c2["B"])["weight"] == 5
 
+    def test_clone_with_edges_matches_source(self, nodes):
+        a, b, c = nodes
+        g = Graph()
+        g.add_edge(a, b, weight=5)
+        g.add_edge(b, c)
+        # Edges to non-members are not copied
+        b.add_dependent(Graphable("X"))
+
+        clone = g.clone(include_edges=True)
+        assert clone.edge_count == 2
+        assert clone.checksum() == g.checksum()
+        assert clone.topological_order()[0].reference == "A"
+
+        # Attribute dicts are copies, not shared with the source edge
+        clone["A"].set_edge_attribute(clone["B"], "weight", 7)
+        assert a.edge_attributes(b)["weight"] == 5
+
     def test_checksum_includes_metadata(self, nodes):
         a, b, _ = nodes
         g = Graph({a, b})
@@ -871,6 +1214,28 @@ class TestGraph:
         # Check for tags/attributes if possible, or just confirm it runs
         # The logic for color:orange and color:green should be hit
 
+    def test_map_layers(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        a = Graphable("A")
+        b = Graphable("B")
+        c = Graphable("C")
+        g = Graph()
+        g.add_edge(a, b)
+        g.add_edge(a, c)
+
+        seen: list[str] = []
+
+        def visit(node):
+            seen.append(node.reference)
+            return node.reference.lower()
+
+        assert g.map_layers(visit) == {a: "a", b: "b", c: "c"}
+        assert seen[0] == "A"
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            assert g.map_layers(visit, executor=executor) == {a: "a", b: "b", c: "c"}
+
     def test_parallelized_topological_order_filtered(self):
         g = Graph()
         a = Graphable("A")
@@ -893,3 +1258,41 @@ class TestGraph:
         order = g.parallelized_topological_order_tagged("v1")
         assert len(order) == 1
         assert list(order[0])[0].reference == "A"
+
+    def test_parallelized_topological_order_tagged_cached(self):
+        g = Graph()
+        a = Graphable("A")
+        a.add_tag("v1")
+        b = Graphable("B")
+        g.add_edge(a, b)
+
+        order = g.parallelized_topological_order_tagged("v1")
+        assert g.parallelized_topological_order_tagged("v1") is order
+
+        # A tag change on a member node drops the cached result
+        b.add_tag("v1")
+        assert g.parallelized_topological_order_tagged("v1") == [{a}, {b}]
+
+    def test_parallelized_topological_order_filtered_cache_key(self):
+        g = Graph()
+        a = Graphable("A")
+        b = Graphable("B")
+        g.add_edge(a, b)
+
+        calls = []
+
+        def is_a(n):
+            calls.append(n)
+            return n is a
+
+        order = g.parallelized_topological_order_filtered(is_a, cache_key="a")
+        assert g.parallelized_topological_order_filtered(is_a, cache_key="a") is order
+        assert len(calls) == 2
+
+        # Without a key the predicate runs every time
+        g.parallelized_topological_order_filtered(is_a)
+        assert len(calls) == 4
+
+        g.add_node(Graphable("C"))
+        assert g.parallelized_topological_order_filtered(is_a, cache_key="a") == [{a}]
+        assert len(calls) == 7
@@ -131,6 +131,19 @@ class TestGraphable:
         assert "t3" not in node.tags
         assert node.tags == {"t1", "t2"}
 
+    def test_sorted_tags(self):
+        node = Graphable("A")
+        assert node.sorted_tags == ()
+        node.add_tag("b")
+        node.add_tag("a")
+        assert node.sorted_tags == ("a", "b")
+        assert node.sorted_tags is node.sorted_tags
+
+        node.add_tag("c")
+        assert node.sorted_tags == ("a", "b", "c")
+        node.remove_tag("a")
+        assert node.sorted_tags == ("b", "c")
+
     def test_remove_tag_existing(self):
         node = Graphable("A")
         node.add_tag("t1")
@@ -160,20 +173,47 @@ class TestGraphable:
         node.add_dependency(node_b)
         assert node.reference == ref_val
 
-    def test_dependents_property_is_copy(self):
+    def test_dependents_property_is_read_only_view(self):
         node = Graphable("A")
         deps = node.dependents
-        assert isinstance(deps, set)
-        # Modifying the returned set shouldn't modify the internal set
-        deps.add(Graphable("junk"))
-        assert len(node.dependents) == 0
-
-    def test_depends_on_property_is_copy(self):
+        assert not hasattr(deps, "add")
+        assert len(deps) == 0
+        # The view reflects later changes
+        other = Graphable("B")
+        node.add_dependent(other)
+        assert deps == {other}
+
+    def test_depends_on_property_is_read_only_view(self):
         node = Graphable("A")
         deps = node.depends_on
-        assert isinstance(deps, set)
-        deps.add(Graphable("junk"))
-        assert len(node.depends_on) == 0
+        assert not hasattr(deps, "add")
+        assert len(deps) == 0
+        other = Graphable("B")
+        node.add_dependency(other)
+        assert deps == {other}
+
+    def test_copy_dependents_and_depends_on(self):
+        a = Graphable("A")
+        b = Graphable("B")
+        c = Graphable("C")
+        a.add_dependent(b)
+        a.add_dependent(c)
+
+        # Snapshots are plain sets that survive edge changes during iteration
+        for node in a.copy_dependents():
+            a._remove_dependent(node)
+        assert len(a.dependents) == 0
+
+        deps = b.copy_depends_on()
+        assert deps == {a}
+        deps.add(c)
+        assert b.depends_on == {a}
+
+    def test_slots(self):
+        node = Graphable("A")
+        assert not hasattr(node, "__dict__")
+        with raises(AttributeError):
+            node.unknown = 1  # type: ignore[attr-defined]
 
     def test_provides_to_alias(self):
         node_a = Graphable("A")
@@ -346,3 +386,46 @@ class TestGraphable:
         mock_observer = MagicMock()
         # Should not raise
         a._unregister_observer(mock_observer)
+
+    def test_shallow_clone(self):
+        a = Graphable("A")
+        b = Graphable("B")
+        a.add_dependent(b)
+        a.add_tag("t1")
+        a.duration = 2.0
+        a.status = "done"
+        observer = MagicMock()
+        a._register_observer(observer)
+
+        clone = a._shallow_clone()
+        assert clone is not a
+        assert clone.reference == "A"
+        assert clone.tags == {"t1"}
+        assert clone.duration == 2.0
+        assert clone.status == "done"
+        assert len(clone.dependents) == 0
+        assert observer not in clone._observers
+
+        # Tags and observers are not shared with the original
+        clone.add_tag("t2")
+        assert a.tags == {"t1"}
+        assert observer in a._observers
+
+    def test_shallow_clone_subclass_state(self):
+        class Slotted(Graphable[str]):
+            __slots__ = ("extra",)
+
+        class Loose(Graphable[str]):
+            pass
+
+        s = Slotted("S")
+        s.extra = 1
+        s_clone = s._shallow_clone()
+        assert type(s_clone) is Slotted
+        assert s_clone.extra == 1
+
+        loose = Loose("L")
+        loose.note = "kept"
+        l_clone = loose._shallow_clone()
+        assert type(l_clone) is Loose
+        assert l_clone.note == "kept"
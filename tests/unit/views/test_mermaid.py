@@ -7,11 +7,11 @@ from pytest import fixture, raises
 from graphable.graph import Graph
 from graphable.graphable import Graphable
 from graphable.views.mermaid import (
+    _IMAGE_CACHE,
     MermaidStylingConfig,
     _check_mmdc_on_path,
     _cleanup_on_exit,
-    _create_mmdc_script,
-    _execute_build_script,
+    _execute_mmdc,
     create_topology_mermaid_mmd,
     export_topology_mermaid_image,
     export_topology_mermaid_mmd,
@@ -54,6 +54,39 @@ class TestMermaid:
         assert "style A fill:#f9f,stroke:#333" in mmd
         assert "linkStyle default stroke-width:2px,fill:none,stroke:red" in mmd
 
+    def test_create_topology_mermaid_mmd_node_ref_computed_once(self, graph_fixture):
+        g, a, b = graph_fixture
+        node_ref_fnc = MagicMock(side_effect=lambda n: str(n.reference))
+        config = MermaidStylingConfig(node_ref_fnc=node_ref_fnc)
+
+        mmd = create_topology_mermaid_mmd(g, config)
+
+        assert "A --> B" in mmd
+        assert node_ref_fnc.call_count == 2
+
+    def test_create_topology_mermaid_mmd_shared_ref_and_text_fnc(self, graph_fixture):
+        g, a, b = graph_fixture
+        fnc = MagicMock(side_effect=lambda n: f"n{n.reference}")
+        config = MermaidStylingConfig(node_ref_fnc=fnc, node_text_fnc=fnc)
+
+        mmd = create_topology_mermaid_mmd(g, config)
+
+        assert "nA[nA]" in mmd
+        assert "nA --> nB" in mmd
+        assert fnc.call_count == 2
+
+    def test_create_topology_mermaid_mmd_without_style_fncs(self, graph_fixture):
+        g, a, b = graph_fixture
+        config = MermaidStylingConfig(
+            node_style_fnc=None,
+            node_style_default="fill:#eee",
+            link_style_fnc=None,
+        )
+        mmd = create_topology_mermaid_mmd(g, config)
+        assert "style A fill:#eee" in mmd
+        assert "style B fill:#eee" in mmd
+        assert "linkStyle" not in mmd
+
     def test_create_topology_mermaid_mmd_link_style(self, graph_fixture):
         g, a, b = graph_fixture
         config = MermaidStylingConfig(link_style_fnc=lambda n, sn: "stroke:blue")
@@ -81,29 +114,24 @@ class TestMermaid:
         with raises(FileNotFoundError):
             _check_mmdc_on_path()
 
-    def test_create_mmdc_script(self):
-        content = "test script content"
-        script_path = _create_mmdc_script(content)
-        try:
-            assert script_path.exists()
-            assert script_path.read_text() == content
-        finally:
-            script_path.unlink()
-
     @patch("graphable.views.mermaid.run")
-    def test_execute_build_script_success(self, mock_run):
+    def test_execute_mmdc_success(self, mock_run):
         mock_run.return_value = MagicMock()
-        assert _execute_build_script(Path("dummy.sh")) is True
+        assert _execute_mmdc(Path("in.mmd"), Path("out.svg")) is True
+        args = mock_run.call_args[0][0]
+        assert args[0] == "mmdc"
+        assert args[args.index("-i") + 1] == "in.mmd"
+        assert args[args.index("-o") + 1] == "out.svg"
 
     @patch("graphable.views.mermaid.run")
-    def test_execute_build_script_failure(self, mock_run):
+    def test_execute_mmdc_failure(self, mock_run):
         mock_run.side_effect = CalledProcessError(1, "cmd", stderr="error message")
-        assert _execute_build_script(Path("dummy.sh")) is False
+        assert _execute_mmdc(Path("in.mmd"), Path("out.svg")) is False
 
     @patch("graphable.views.mermaid.run")
-    def test_execute_build_script_not_found(self, mock_run):
+    def test_execute_mmdc_not_found(self, mock_run):
         mock_run.side_effect = FileNotFoundError()
-        assert _execute_build_script(Path("dummy.sh")) is False
+        assert _execute_mmdc(Path("in.mmd"), Path("out.svg")) is False
 
     @patch("graphable.views.mermaid.Path.unlink")
     def test_cleanup_on_exit_exists(self, mock_unlink):
@@ -120,15 +148,13 @@ class TestMermaid:
         mock_path.unlink.assert_not_called()
 
     @patch("graphable.views.mermaid.Path.unlink")
-    @patch("graphable.views.mermaid._execute_build_script")
-    @patch("graphable.views.mermaid._create_mmdc_script")
+    @patch("graphable.views.mermaid._execute_mmdc")
     @patch("graphable.views.mermaid.NamedTemporaryFile")
     @patch("graphable.views.mermaid._check_mmdc_on_path")
     def test_export_topology_mermaid_image_svg(
         self,
         mock_check,
         mock_temp,
-        mock_create_script,
         mock_exec,
         mock_unlink,
         graph_fixture,
@@ -141,27 +167,22 @@ class TestMermaid:
         mock_temp_file.name = "temp.mmd"
         mock_temp.return_value.__enter__.return_value = mock_temp_file
 
-        mock_script_path = MagicMock(spec=Path)
-        mock_create_script.return_value = mock_script_path
-
         mock_exec.return_value = True
 
         export_topology_mermaid_image(g, output_path)
 
         mock_check.assert_called_once()
-        mock_exec.assert_called_with(mock_script_path)
-        assert mock_script_path.unlink.call_count == 1
+        mock_exec.assert_called_with(Path("temp.mmd"), output_path)
+        assert mock_unlink.call_count == 1
 
     @patch("graphable.views.mermaid.Path.unlink")
-    @patch("graphable.views.mermaid._execute_build_script")
-    @patch("graphable.views.mermaid._create_mmdc_script")
+    @patch("graphable.views.mermaid._execute_mmdc")
     @patch("graphable.views.mermaid.NamedTemporaryFile")
     @patch("graphable.views.mermaid._check_mmdc_on_path")
     def test_export_topology_mermaid_image_png(
         self,
         mock_check,
         mock_temp,
-        mock_create_script,
         mock_exec,
         mock_unlink,
         graph_fixture,
@@ -174,27 +195,24 @@ class TestMermaid:
         mock_temp_file.name = "temp.mmd"
         mock_temp.return_value.__enter__.return_value = mock_temp_file
 
-        mock_script_path = MagicMock(spec=Path)
-        mock_create_script.return_value = mock_script_path
-
         mock_exec.return_value = True
 
         export_topology_mermaid_image(g, output_path)
 
         mock_check.assert_called_once()
-        mock_exec.assert_called_with(mock_script_path)
-        assert mock_script_path.unlink.call_count == 1
+        mock_exec.assert_called_with(Path("temp.mmd"), output_path)
+        assert mock_unlink.call_count == 1
 
-    @patch("graphable.views.mermaid._execute_build_script")
-    @patch("graphable.views.mermaid._create_mmdc_script")
+    @patch("graphable.views.mermaid.Path.unlink")
+    @patch("graphable.views.mermaid._execute_mmdc")
     @patch("graphable.views.mermaid.NamedTemporaryFile")
     @patch("graphable.views.mermaid._check_mmdc_on_path")
     def test_export_topology_mermaid_image_failure(
         self,
         mock_check,
         mock_temp,
-        mock_create_script,
         mock_exec,
+        mock_unlink,
         graph_fixture,
     ):
         g, _, _ = graph_fixture
@@ -205,15 +223,40 @@ class TestMermaid:
         mock_temp_file.name = "temp.mmd"
         mock_temp.return_value.__enter__.return_value = mock_temp_file
 
-        mock_script_path = MagicMock(spec=Path)
-        mock_create_script.return_value = mock_script_path
-
         mock_exec.return_value = False
 
         export_topology_mermaid_image(g, output_path)
 
-        mock_exec.assert_called_with(mock_script_path)
-        assert mock_script_path.unlink.call_count == 0
+        mock_exec.assert_called_with(Path("temp.mmd"), output_path)
+        assert mock_unlink.call_count == 0
+
+    @patch("graphable.views.mermaid._execute_mmdc")
+    @patch("graphable.views.mermaid._check_mmdc_on_path")
+    def test_export_topology_mermaid_image_reuses_cached_render(
+        self, mock_check, mock_exec, graph_fixture, tmp_path
+    ):
+        g, _, _ = graph_fixture
+        first = tmp_path / "first.svg"
+        second = tmp_path / "second.svg"
+
+        def render(source, output):
+            first.write_text("<svg/>")
+            return True
+
+        mock_exec.side_effect = render
+        _IMAGE_CACHE.clear()
+
+        export_topology_mermaid_image(g, first)
+        export_topology_mermaid_image(g, second)
+
+        assert mock_exec.call_count == 1
+        assert second.read_text() == "<svg/>"
+
+        # A modified render is not reused
+        first.write_text("<svg>changed</svg>")
+        export_topology_mermaid_image(g, second)
+        assert mock_exec.call_count == 2
+        _IMAGE_CACHE.clear()
 
     def test_create_topology_mermaid_mmd_clustering(self):
         a = Graphable("A")